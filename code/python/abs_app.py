@@ -0,0 +1,521 @@
+"""ABS 중계 화면 (인트로/모드 선택 + 경기 화면) 공용 구현.
+
+1_abs_gui_test.py(모드1 고정, COM13)와 2_mode_test.py(모드 선택, COM10)는
+main()의 인자만 다른 실행 파일이다. 카메라와 UART 는 프로세스 시작 시
+abs_core.IOCore 가 한 번 열고, 화면들은 그 위에 붙었다 떨어지는 뷰다.
+
+시작 순서 (첫 인트로 화면을 먼저 그리고 나머지는 인트로가 도는 동안)
+
+    1. QApplication + 인트로 창 (Qt 위젯만 import)
+    2. 첫 paint 직후 QtMultimedia import, intro.mp4 / intro_bgm.mp3 재생
+    3. 백그라운드 스레드: cv2 / serial / abs_core / abs_game import, 이미지 디코딩
+    4. GUI 스레드: IOCore 시작 (카메라/UART 연결), 이미지 캐시 채움
+
+    python 2_mode_test.py --profile-startup     # 단계별 시간 출력
+"""
+import argparse
+import importlib
+import sys
+import threading
+from PyQt5.QtWidgets import QApplication, QWidget, QLabel
+from PyQt5.QtCore import Qt, QObject, QUrl, QTimer, pyqtSignal
+from asset_cache import assets, load_images
+from tracing import startup, tracer
+
+# --- 색상 및 설정 ---
+OVERLAY_BG_COLOR = '#2E4636'
+CHAT_BG_COLOR = '#2E4636'
+FONT_COLOR = 'white'
+INACTIVE_DOT_COLOR = '#5F6368'
+BALL_COLOR = '#8BC34A'
+STRIKE_COLOR = '#FBCB0A'
+OUT_COLOR = '#D93025'
+DIGITAL_GREEN = '#00FF00'
+DIGITAL_YELLOW = '#FFFF00'
+DIGITAL_RED = '#FF0000'
+
+# --- 영상 갱신 주기 (ms) 및 스케일 모드 ('fast' / 'smooth', video_pipeline.SCALE_*) ---
+FRAME_POLL_INTERVAL_MS = 16
+VIDEO_SCALE_MODE = 'smooth'
+# --- 경기 화면 영상 크기 (인트로 동안 캡처 스레드가 미리 이 크기로 축소) ---
+VIDEO_SIZE = (1333, 1000)
+
+# --- 경기 중계 로그: 화면에 남길 줄 수, 밀려난 줄을 저장할 파일 (None 이면 저장 안 함) ---
+CHAT_LOG_CAPACITY = 200
+CHAT_LOG_SPILL_PATH = None
+
+# --- 소프트웨어 판정 (soft_judge): UART 가 끊기면 대신 판정, 연결 중에는 FPGA 와 교차 검증 ---
+SOFT_JUDGE_ENABLED = False
+SOFT_JUDGE_LOG_PATH = 'judge_mismatch.log'
+
+# --- 판정 전후 영상 클립 저장 폴더 (None 이면 저장 안 함). 최근 200개 / 512MiB 까지만 보관 (clip_recorder.MAX_CLIPS) ---
+CLIP_DIR = 'clips'
+
+# --- 즉석 리플레이: 표시 위치 ('main' / 'inset'), 슬로 모션 배속, 새 클립 자동 재생 ---
+REPLAY_VIEW = 'inset'
+REPLAY_SPEED = 0.25
+REPLAY_AUTO = True
+
+# --- 세션 이벤트 DB (None 이면 기록 안 함, 조회: python session_store.py stats sessions.db) ---
+SESSION_DB_PATH = 'sessions.db'
+
+# --- 판정 -> 화면 지연 추적 (T 키로 켜고 끔, 끌 때와 종료 시 Chrome trace 저장) ---
+TRACE_ENABLED = False
+TRACE_EXPORT_PATH = 'abs_trace.json'
+
+# --- 첫 인트로 화면 목표 시간 (ms, --profile-startup 보고에서 비교) ---
+STARTUP_BUDGET_MS = 300
+
+# 인트로가 도는 동안 백그라운드에서 import 해 두는 무거운 모듈
+WARM_MODULES = ('numpy', 'cv2', 'serial', 'abs_core', 'abs_game')
+
+# --- 카메라 캡처 형식: None 인 항목은 드라이버 기본값. 실제로 잡힌 값은 상태 메시지로 표시 ---
+# 카메라 두 대를 USB2 한 허브에 물리면 무압축(YUY2)은 대역폭이 모자라므로 MJPG.
+# 장치가 지원하는 형식과 실제 FPS/지연 측정: python capture_probe.py 1
+CAPTURE_PROFILE = {'width': 640, 'height': 480, 'fps': 30, 'fourcc': 'MJPG', 'buffer_size': 1}
+
+# --- FPGA 보드 UART 찾기: 실행 파일이 넘긴 포트 (COM13 / COM10) 가 없으면 이 후보 ---
+# Basys3 / Zybo 의 USB-UART 는 FTDI FT2232 (0403:6010) 의 인터페이스 1 (0 은 JTAG).
+# 보드가 여러 대면 'sn:시리얼번호' 로 고정. 목록 확인: python device_discovery.py
+SERIAL_PORT_MATCH = ['usb:0403:6010:1']
+
+# --- FPGA 가 보내는 형식: 'auto' (SYNC 없이 2초 지나면 단일 문자), 'on' (ascii.sv 단일 문자), 'off' (v1 프레임만) ---
+# 'auto' 는 연결 직후 첫 올바른 프레임 전까지의 바이트를 버린다. 보드 형식을 알면 고정해 둘 것
+UART_LEGACY = 'auto'
+
+# --- 카메라 구성: 첫 번째가 메인 화면, 나머지는 picture-in-picture ---
+# 카메라 번호 대신 'usb:VID:PID' / 'name:이름' (연결할 때마다 찾음, device_discovery),
+# 동영상 파일 경로나 'synthetic' 도 쓸 수 있음 (video_sources.open_source)
+CAMERA_SOURCES = [
+    ('정면', 1),
+    ('측면', 2),
+]
+
+# ======================
+# 인트로 화면 클래스 (수정됨)
+# ======================
+class IntroScreen(QWidget):
+    def __init__(self, app, select_mode=True):
+        super().__init__()
+        # 장치는 AbsApp 의 IOCore 가 소유 (모드 선택은 app.send 로만 전달)
+        self.app = app
+        self.select_mode = select_mode
+        # 미디어 플레이어들 (QtMultimedia 는 첫 화면을 그린 뒤 start_media 에서 생성)
+        self.music_player = None
+        self.music_playlist = None
+        self.video_player = None
+        self.video_playlist = None
+        self.video_widget = None
+        self.first_paint = False
+
+        # UI 요소
+        self.label = None
+        self.blink_timer = None
+        self.mode1_button = None
+        self.mode2_button = None
+        self.selected_mode = None  # 추가: 현재 선택된 모드 추적
+
+        self.initUI()
+        self.showFullScreen()
+
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setStyleSheet("background-color: transparent;")
+
+    def initUI(self):
+        self.setWindowTitle('인트로 화면')
+
+        # any_key.png 는 3초 뒤 처음 보일 때 설정 (그 사이 백그라운드에서 디코딩됨)
+        self.label = QLabel(self)
+        self.label.setScaledContents(True)
+        self.label.setFixedSize(600, 150)
+        self.label.setAttribute(Qt.WA_TranslucentBackground)
+        self.label.setAlignment(Qt.AlignCenter)
+
+        # 비디오 위에 항상 표시
+        self.label.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
+        self.update_label_geometry()
+
+        # 깜빡거림 타이머
+        self.blink_timer = QTimer(self)
+        self.blink_timer.timeout.connect(self.toggle_label_visibility)
+
+        self.label.hide()
+        QTimer.singleShot(3000, self.show_label)  # 3초 후 라벨 보이기 시작
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.first_paint:
+            self.first_paint = True
+            startup.mark('intro_first_paint')
+            # 이 paint 가 화면에 나간 뒤 다음 이벤트 루프에서 미디어 시작
+            QTimer.singleShot(0, self.start_media)
+
+    def start_media(self):
+        # QtMultimedia import + 디코더 초기화는 첫 화면 이후로 미룸
+        from PyQt5.QtMultimedia import QMediaPlayer, QMediaPlaylist, QMediaContent
+        from PyQt5.QtMultimediaWidgets import QVideoWidget
+        self.music_player = QMediaPlayer()
+        self.music_playlist = QMediaPlaylist()
+        self.video_player = QMediaPlayer()
+        self.video_playlist = QMediaPlaylist()
+
+        # --- 비디오 위젯 ---
+        self.video_widget = QVideoWidget(self)
+        self.video_widget.setGeometry(self.rect())
+        self.video_widget.lower()
+        self.video_widget.show()
+        self.video_player.setVideoOutput(self.video_widget)
+
+        # intro.mp4 로드
+        intro_video_url = QUrl.fromLocalFile('intro.mp4')
+        if intro_video_url.isValid():
+            self.video_playlist.addMedia(QMediaContent(intro_video_url))
+            self.video_playlist.setPlaybackMode(QMediaPlaylist.CurrentItemOnce)
+            self.video_player.setPlaylist(self.video_playlist)
+            self.video_player.setVolume(0)
+            self.video_player.play()
+            self.video_player.mediaStatusChanged.connect(self.handle_video_status)
+        else:
+            print("오류: 'intro.mp4' 파일을 찾을 수 없거나 유효하지 않습니다.")
+
+        self.play_background_music('intro_bgm.mp3')
+        startup.mark('intro_media')
+        # 인트로가 도는 동안 나머지 준비 (cv2, 장치 연결, 이미지)
+        self.app.warm_up()
+
+    def toggle_label_visibility(self):
+        """라벨을 깜박거리게 제어"""
+        if self.label.isVisible():
+            self.label.hide()
+        else:
+            self.label.show()
+
+    def show_label(self):
+        if self.label:
+            self.label.setPixmap(assets.pixmap("any_key.png"))
+            self.label.show()
+            # 깜박임 시작
+            if self.blink_timer:
+                self.blink_timer.start(500)
+
+    def keep_last_frame(self, status):
+        if status == self.video_player.EndOfMedia:
+            self.video_widget.hide()
+            self.video_label = QLabel(self)
+            self.video_label.setPixmap(assets.scaled("intro_last_frame.png", self.width(), self.height(), Qt.KeepAspectRatio))
+            self.video_label.setGeometry(self.rect())
+            self.video_label.show()
+
+    def play_background_music(self, filename):
+        from PyQt5.QtMultimedia import QMediaPlaylist, QMediaContent
+        try:
+            url = QUrl.fromLocalFile(filename)
+            if url.isValid():
+                self.music_playlist.clear()
+                self.music_playlist.addMedia(QMediaContent(url))
+                self.music_playlist.setPlaybackMode(QMediaPlaylist.Loop)
+                self.music_player.setPlaylist(self.music_playlist)
+                self.music_player.setVolume(30)
+                self.music_player.play()
+        except Exception as e:
+            pass
+
+    def handle_video_status(self, status):
+        if status == self.video_player.EndOfMedia:
+            self.video_player.stop()
+
+    def keyPressEvent(self, event):
+        # Escape 키로 종료
+        if event.key() == Qt.Key_Escape:
+            self.app.shutdown()
+            return
+
+        if not self.select_mode:
+            # 플레이어 선택 화면을 건너뛰고 바로 메인 게임 화면으로 이동
+            self.intro_mode_selected("mode1")
+            return
+
+        if self.label.isVisible():
+            self.label.hide()
+            if self.blink_timer and self.blink_timer.isActive():
+                self.blink_timer.stop()
+            self.show_mode_buttons()
+            return
+
+        if self.mode1_button and self.mode2_button:
+            if event.key() == Qt.Key_Up:
+                self.selected_mode = "mode1"
+                self.update_selection_box()
+            elif event.key() == Qt.Key_Down:
+                self.selected_mode = "mode2"
+                self.update_selection_box()
+            elif event.key() == Qt.Key_Return:  # Enter 키
+                if self.selected_mode:
+                    self.intro_mode_selected(self.selected_mode)
+
+    def show_mode_buttons(self):
+        if self.mode1_button or self.mode2_button:
+            return
+
+        # 공통 위치 계산
+        x = (self.width() - 800)
+        y = self.label.y() + self.label.height() + 30
+
+        # --- 모드1 라벨 ---
+        self.mode1_button = QLabel(self)
+        pixmap1 = assets.pixmap("label_mode1.png")
+        self.mode1_button.setPixmap(pixmap1)
+        self.mode1_button.setScaledContents(True)
+        self.mode1_button.setFixedSize(600, 100)
+        self.mode1_button.move(x, y)
+        self.mode1_button.setStyleSheet("background: transparent;")
+        self.mode1_button.setAttribute(Qt.WA_TranslucentBackground)
+        self.mode1_button.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
+        self.mode1_button.show()
+
+        # --- 모드2 라벨 ---
+        self.mode2_button = QLabel(self)
+        pixmap2 = assets.pixmap("label_mode2.png")
+        self.mode2_button.setPixmap(pixmap2)
+        self.mode2_button.setScaledContents(True)
+        self.mode2_button.setFixedSize(600, 100)
+        self.mode2_button.move(x, y + 120)
+        self.mode2_button.setStyleSheet("background: transparent;")
+        self.mode2_button.setAttribute(Qt.WA_TranslucentBackground)
+        self.mode2_button.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
+        self.mode2_button.show()
+
+        # 초기 선택 모드
+        self.selected_mode = "mode1"
+        self.update_selection_box()
+
+
+            
+    def update_selection_box(self):
+        """선택된 모드만 확대, 나머지는 원래 크기"""
+        if not (self.mode1_button and self.mode2_button):
+            return
+
+        base_width, base_height = 600, 100
+        scale_factor = 1.2
+
+        if self.selected_mode == "mode1":
+            # 모드1 확대
+            new_w1 = int(base_width * scale_factor)
+            new_h1 = int(base_height * scale_factor)
+            self.mode1_button.setPixmap(assets.scaled("label_mode1.png", new_w1, new_h1, Qt.KeepAspectRatio))
+            self.mode1_button.setFixedSize(new_w1, new_h1)
+
+            # 모드2 원래 크기
+            self.mode2_button.setPixmap(assets.scaled("label_mode2.png", base_width, base_height, Qt.KeepAspectRatio))
+            self.mode2_button.setFixedSize(base_width, base_height)
+        else:
+            # 모드2 확대
+            new_w2 = int(base_width * scale_factor)
+            new_h2 = int(base_height * scale_factor)
+            self.mode2_button.setPixmap(assets.scaled("label_mode2.png", new_w2, new_h2, Qt.KeepAspectRatio))
+            self.mode2_button.setFixedSize(new_w2, new_h2)
+
+            # 모드1 원래 크기
+            self.mode1_button.setPixmap(assets.scaled("label_mode1.png", base_width, base_height, Qt.KeepAspectRatio))
+            self.mode1_button.setFixedSize(base_width, base_height)
+
+        # 위치 다시 계산 (중앙 정렬, 겹치지 않도록)
+        x = (self.width() - 800)
+        self.mode1_button.move(x, self.label.y() + self.label.height() - 120)
+        x2 = (self.width() - 800)
+        self.mode2_button.move(x2, self.label.y() + self.label.height() + 30)
+
+    def intro_mode_selected(self, mode):
+        # 포트는 열어 둔 채 모드 번호만 FPGA 로 전송
+        if self.select_mode:
+            self.app.send("1" if mode == "mode1" else "2")
+
+        if self.label:
+            self.label.hide()
+        if self.blink_timer and self.blink_timer.isActive():
+            self.blink_timer.stop()
+        
+        if self.mode1_button:
+            self.mode1_button.hide(); self.mode1_button.deleteLater(); self.mode1_button = None
+        if self.mode2_button:
+            self.mode2_button.hide(); self.mode2_button.deleteLater(); self.mode2_button = None
+
+        try:
+            if self.music_player:
+                self.music_player.stop()
+        except:
+            pass
+
+        try:
+            if self.video_player and self.video_player.state() == self.video_player.PlayingState:
+                self.video_player.stop()
+        except:
+            pass
+
+        self.app.start_game(mode)
+
+    def update_label_geometry(self):
+        if self.label:
+            x = self.width() - 800
+            y = 150
+            self.label.setGeometry(x, y, self.label.width(), self.label.height())
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self.video_widget:
+            self.video_widget.setGeometry(self.rect())
+        self.update_label_geometry() 
+
+        # 모드 라벨 위치 조정
+        if self.mode1_button:
+            x = (self.width() - self.mode1_button.width()) // 2
+            self.mode1_button.move(x, self.label.y() + self.label.height() + 30)
+        if self.mode2_button:
+            x = (self.width() - self.mode2_button.width()) // 2
+            self.mode2_button.move(x, self.label.y() + self.label.height() + 150)
+
+    def closeEvent(self, event):
+        try:
+            if self.music_player:
+                self.music_player.stop()
+            if self.video_player and self.video_player.state() == self.video_player.PlayingState:
+                self.video_player.stop()
+        except:
+            pass
+        if self.label:
+            self.label.close()
+        super().closeEvent(event)
+
+
+# ======================
+# 화면 전환 + 장치 수명 관리
+# ======================
+class AbsApp(QObject):
+    """IOCore 를 한 번 열고 인트로 <-> 경기 화면을 오가며 같은 코어를 넘겨준다."""
+    # 백그라운드 준비 완료: 디코딩해 둔 {이름: QImage}
+    warmed = pyqtSignal(object)
+
+    def __init__(self, port, select_mode=True, glow=False, profile=False):
+        super().__init__()
+        self.port = port
+        self.select_mode = select_mode
+        self.glow = glow
+        self.profile = profile
+        self.core = None
+        self.intro = None
+        self.game = None
+        self.closing = False
+        self.warm_thread = None
+        self.warmed.connect(self._finish_warm_up)
+        tracer.enable(TRACE_ENABLED)
+
+    def start(self):
+        # 장치와 무거운 모듈은 인트로 첫 화면 뒤 warm_up 에서 (IntroScreen.start_media)
+        self.show_intro()
+
+    def show_intro(self):
+        self.intro = IntroScreen(self, select_mode=self.select_mode)
+
+    # ======================
+    # 백그라운드 준비 (인트로 재생 중)
+    # ======================
+    def warm_up(self):
+        """무거운 import 와 이미지 디코딩을 작업 스레드로. 여러 번 불려도 한 번만."""
+        if self.warm_thread is not None:
+            return
+        self.warm_thread = threading.Thread(target=self._warm_loop, name='warm-up', daemon=True)
+        self.warm_thread.start()
+
+    def _warm_loop(self):
+        for name in WARM_MODULES:
+            try:
+                importlib.import_module(name)
+            except ImportError as e:
+                print(f"미리 import 실패: {name} ({e})")
+            startup.mark(f"import {name}")
+        images = load_images()
+        startup.mark('images_decoded')
+        self.warmed.emit(images)
+
+    def _finish_warm_up(self, images):
+        assets.adopt(images)
+        startup.mark('assets_cached')
+        self.start_core()
+        if self.profile:
+            self.print_startup()
+
+    def start_core(self):
+        """카메라/UART 연결 시작. 장치 연결은 각 스레드에서 진행된다."""
+        if self.core is not None:
+            return
+        from abs_core import IOCore
+        self.core = IOCore(CAMERA_SOURCES, port=[self.port] + SERIAL_PORT_MATCH, soft_judge=SOFT_JUDGE_ENABLED,
+                           clip_dir=CLIP_DIR, frame_size=VIDEO_SIZE, capture_profile=CAPTURE_PROFILE,
+                           uart_legacy=UART_LEGACY)
+        self.core.start()
+        startup.mark('core_started')
+
+    def print_startup(self):
+        print(f"시작 단계별 시간\n{startup.report()}")
+        first = startup.elapsed_ms('intro_first_paint')
+        if first is not None:
+            verdict = '목표 이내' if first <= STARTUP_BUDGET_MS else '목표 초과'
+            print(f"첫 인트로 화면 {first:.0f}ms ({verdict}, 목표 {STARTUP_BUDGET_MS}ms)")
+
+    # ======================
+    # 화면 전환
+    # ======================
+    def send(self, data):
+        self.start_core()
+        self.core.send(data)
+
+    def start_game(self, mode):
+        # 준비가 덜 끝났으면 여기서 마저 (이미 import 중이면 끝날 때까지 대기)
+        self.start_core()
+        from abs_game import BaseballGUI_PyQt
+        intro, self.intro = self.intro, None
+        if self.game is None:
+            self.game = BaseballGUI_PyQt(self, mode=mode if self.select_mode else "mode1", glow=self.glow)
+        else:
+            self.game.apply_selected_mode(mode)
+        if intro is not None:
+            intro.close()
+
+    def back_to_intro(self):
+        # 인트로를 먼저 띄워야 창이 하나도 없는 순간(= 앱 종료)이 생기지 않음
+        self.show_intro()
+        if self.game is not None:
+            self.game.detach()
+            self.game.hide()
+
+    def shutdown(self):
+        if self.closing:
+            return
+        self.closing = True
+        if self.intro is not None:
+            self.intro.close()
+        if self.game is not None:
+            self.game.close()
+        # 화면이 모두 정리된 뒤 장치를 닫음 (프로세스 수명 동안 한 번)
+        if self.core is not None:
+            self.core.stop()
+        print(f"이미지 캐시 {assets.stats()}")
+        QApplication.instance().quit()
+
+
+def main(port, select_mode=True, glow=False, t0=None):
+    """t0: 실행 파일이 import 전에 잰 perf_counter (--profile-startup 기준점)."""
+    parser = argparse.ArgumentParser(description='ABS 중계 화면')
+    parser.add_argument('--profile-startup', action='store_true', help='시작 단계별 시간 출력')
+    args, qt_args = parser.parse_known_args(sys.argv[1:])
+    if t0 is not None:
+        startup.start(t0)
+    startup.mark('main')
+    app = QApplication(sys.argv[:1] + qt_args)
+    startup.mark('qt_app')
+    controller = AbsApp(port, select_mode=select_mode, glow=glow, profile=args.profile_startup)
+    controller.start()
+    exit_code = app.exec_()
+    controller.shutdown()
+    return exit_code
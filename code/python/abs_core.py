@@ -0,0 +1,478 @@
+"""카메라 + UART 입출력 코어 (프로세스당 하나, 화면 전환과 무관하게 유지).
+
+인트로/모드 선택 화면과 경기 화면은 IOCore 의 시그널에 붙었다 떨어질 뿐
+장치를 직접 열고 닫지 않는다. 그래서 모드를 바꿔도 시리얼 포트를 다시 열지
+않고, 전환 중에 들어온 바이트도 잃지 않는다.
+
+인트로가 도는 동안에도 카메라는 계속 읽는다. 아무도 가져가지 않는 동안
+메인 카메라는 우편함의 최신 한 장, 보조 카메라는 FrameHistory 몇 장만
+남기고 나머지는 링으로 돌려주므로 메모리는 링 크기로 고정된다. 경기 화면은
+붙는 즉시 그 최신 프레임을 그린다.
+
+케이블이 흔들려 장치가 끊기면 각 스레드가 스스로 닫고 대기 시간을 늘려 가며
+다시 연다 (포트/카메라 번호가 바뀌어도 device_discovery 로 다시 찾음).
+끊겨 있던 시간과 다시 여는 데 걸린 시간은 IOCore.health() 로 볼 수 있다.
+
+    core = IOCore(CAMERA_SOURCES, port='COM10')
+    core.start()
+    core.data_signal.connect(view.handle_uart_data)
+"""
+import time
+from collections import deque
+
+import serial
+from PyQt5.QtCore import QObject, QRect, QThread, QTimer, pyqtSignal
+
+from clip_recorder import ClipRecorder
+from device_discovery import find_serial_port, resolve_camera
+from soft_judge import SoftJudge
+from tracing import startup, tracer
+from uart_link import LEGACY_AUTO, CallDecoder
+from video_pipeline import CaptureManager, FrameConverter, FrameMailbox, pip_rect
+from video_sources import CaptureProfile, open_source, profile_mismatches
+
+STATUS_HISTORY = 20     # 화면이 붙기 전에 나온 상태 메시지 보관 수
+
+# --- 재연결: 실패할 때마다 대기 시간을 두 배로 (최소 ~ 최대, 초) ---
+RECONNECT_MIN_SECONDS = 0.25
+RECONNECT_MAX_SECONDS = 5.0
+# --- 카메라 멈춤 판정: 연결 후 첫 프레임까지 / 그 뒤 프레임 사이 허용 시간 (초) ---
+FIRST_FRAME_TIMEOUT_SECONDS = 5.0
+STALL_SECONDS = 1.5
+SUPERVISE_INTERVAL_MS = 500
+
+
+def _sleep_while_running(thread, seconds):
+    """stop() 이 불리면 바로 깨어나는 sleep."""
+    deadline = time.monotonic() + seconds
+    while thread.running and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+
+# ======================
+# 연결 상태 기록
+# ======================
+class LinkHealth:
+    """장치 하나의 연결/끊김 기록 (초 단위, monotonic 기준).
+
+    outage 는 끊김을 감지한 시각부터 다시 연결될 때까지, connect 는 성공한
+    열기 한 번에 걸린 시간(장치 협상 포함)이다.
+    """
+
+    def __init__(self):
+        self.connected = False
+        self.attempts = 0
+        self.connects = 0
+        self.outages = 0
+        self.outage_total = 0.0
+        self.outage_max = 0.0
+        self.last_outage = None
+        self.last_connect = None
+        self._down_since = None
+        self._failing = False
+
+    def fail(self):
+        """연결 시도 실패. 연속 실패 중 첫 번째면 True (메시지는 한 번만 내려고)."""
+        self.attempts += 1
+        first = not self._failing
+        self._failing = True
+        return first
+
+    def up(self, connect_seconds):
+        """연결 성공. 끊겼다가 복구된 것이면 끊겨 있던 시간, 아니면 None."""
+        self.attempts += 1
+        self.connects += 1
+        self.connected = True
+        self._failing = False
+        self.last_connect = connect_seconds
+        if self._down_since is None:
+            return None
+        outage = time.monotonic() - self._down_since
+        self._down_since = None
+        self.outages += 1
+        self.outage_total += outage
+        self.outage_max = max(self.outage_max, outage)
+        self.last_outage = outage
+        return outage
+
+    def down(self):
+        if self.connected:
+            self.connected = False
+            self._down_since = time.monotonic()
+
+    def stats(self):
+        down_for = None if self._down_since is None else time.monotonic() - self._down_since
+        return {
+            'connected': self.connected,
+            'attempts': self.attempts,
+            'outages': self.outages,
+            'outage_total_s': round(self.outage_total, 2),
+            'outage_max_s': round(self.outage_max, 2),
+            'last_outage_s': None if self.last_outage is None else round(self.last_outage, 2),
+            'down_for_s': None if down_for is None else round(down_for, 2),
+            'last_connect_ms': None if self.last_connect is None else round(self.last_connect * 1000),
+        }
+
+
+# ======================
+# 비디오 캡처 전용 스레드
+# ======================
+class VideoThread(QThread):
+    status_signal = pyqtSignal(str)
+
+    def __init__(self, camera_index=1, name='', profile=None):
+        super().__init__()
+        # 번호, 'usb:VID:PID', 'name:...', 파일 경로, 'synthetic' (연결할 때마다 다시 찾음)
+        self.camera_index = camera_index
+        self.name = name
+        # 요청할 캡처 형식 (CaptureProfile, None 이면 드라이버 기본값)
+        self.profile = profile
+        self.mode = None                # 실제로 잡힌 형식 'WxH@fps FOURCC'
+        self.running = True
+        self.history = None
+        self.judge = None
+        self.recorder = None
+        # 프레임마다 시그널을 보내지 않고 최신 프레임 한 장만 보관
+        self.mailbox = FrameMailbox()
+        self.converter = FrameConverter()
+        self.cap = None
+        self.health = LinkHealth()
+        self.last_frame = None          # 마지막 프레임 시각 (monotonic)
+        self.reconnect = False          # 감시 타이머가 다시 열기를 요청
+        # 장치 열기 / 첫 프레임까지 걸린 시간 (초, 아직이면 None)
+        self.open_seconds = None
+        self.first_frame_seconds = None
+        self._t_open = None
+
+    def run(self):
+        # 연결 -> 읽기 -> (끊김/멈춤) -> 대기 후 다시 연결, stop() 까지 반복
+        backoff = RECONNECT_MIN_SECONDS
+        while self.running:
+            if not self._open():
+                _sleep_while_running(self, backoff)
+                backoff = min(backoff * 2, RECONNECT_MAX_SECONDS)
+                continue
+            backoff = RECONNECT_MIN_SECONDS
+            self._capture()
+            self._release()
+            if self.running:
+                self.health.down()
+                self.status_signal.emit(f"{self.name} 카메라 끊김, 다시 연결 중".strip())
+
+    def _open(self):
+        t_open = time.perf_counter()
+        error = ''
+        try:
+            spec = resolve_camera(self.camera_index)
+            if spec is None:
+                error = f"일치하는 장치 없음 ({self.camera_index})"
+            else:
+                self.cap = open_source(spec, profile=self.profile)
+        except Exception as e:
+            error = str(e)
+        if self.cap is None or not self.cap.isOpened():
+            self._release()
+            if self.health.fail():
+                self.status_signal.emit(f"{self.name} 카메라 연결 실패 {error}".strip())
+            return False
+        self.open_seconds = time.perf_counter() - t_open
+        self._t_open = t_open
+        outage = self.health.up(self.open_seconds)
+        text = f"{self.name} 카메라 연결됨 ({self.open_seconds * 1000:.0f}ms"
+        if outage is not None:
+            text += f", 끊김 {outage:.1f}s"
+        self.status_signal.emit(f"{text})".strip())
+        self._report_mode()
+        return True
+
+    def _report_mode(self):
+        """요청한 형식과 실제로 잡힌 형식 비교 (카메라만)."""
+        negotiated = getattr(self.cap, 'negotiated', None)
+        if negotiated is None:
+            return
+        self.mode = self.cap.mode()
+        mismatches = profile_mismatches(negotiated)
+        if mismatches:
+            detail = ', '.join(f"{name} {requested}->{actual}" for name, requested, actual in mismatches)
+            self.status_signal.emit(f"{self.name} 캡처 형식 {self.mode} (요청과 다름: {detail})".strip())
+        else:
+            self.status_signal.emit(f"{self.name} 캡처 형식 {self.mode}".strip())
+
+    def _capture(self):
+        """끊기거나 멈출 때까지 읽기. stop() 이면 그냥 반환."""
+        frame = None
+        got_frame = False
+        self.reconnect = False
+        self.last_frame = time.monotonic()
+        while self.running and not self.reconnect:
+            # 같은 BGR 버퍼와 RGB 링을 계속 재사용 (프레임당 할당 없음)
+            try:
+                ret, frame = self.cap.read(frame)
+            except Exception as e:
+                self.status_signal.emit(f"{self.name} 카메라 읽기 오류: {e}".strip())
+                return
+            if not ret:
+                limit = STALL_SECONDS if got_frame else FIRST_FRAME_TIMEOUT_SECONDS
+                if time.monotonic() - self.last_frame > limit:
+                    return
+                time.sleep(0.01)
+                continue
+            got_frame = True
+            self.last_frame = time.monotonic()
+            if self.first_frame_seconds is None:
+                self.first_frame_seconds = time.perf_counter() - self._t_open
+                startup.mark(f"camera {self.name} frame".strip())
+                self.status_signal.emit(
+                    f"{self.name} 첫 프레임 ({self.first_frame_seconds * 1000:.0f}ms)".strip())
+            if self.judge is not None:
+                self.judge.submit(frame)
+            if self.recorder is not None:
+                self.recorder.push_frame(frame)
+            slot = self.converter.convert(frame)
+            if slot is not None:
+                if self.history is not None:
+                    self.history.push(slot)
+                self.mailbox.put(slot)
+
+    def _release(self):
+        if self.cap:
+            try:
+                self.cap.release()
+            except:
+                pass
+        self.cap = None
+
+    def interrupt(self):
+        """감시 타이머(GUI 스레드)에서 호출: 다시 열기 요청.
+
+        장치는 이 스레드가 read() 를 마친 뒤 _release 에서 닫는다 (다른 스레드에서
+        read 중인 VideoCapture 를 닫으면 DSHOW/MSMF 가 멈추거나 죽을 수 있음).
+        read() 가 멈추는 시간은 열 때 준 CAPTURE_READ_TIMEOUT_MS 로 제한된다.
+        """
+        self.reconnect = True
+
+    def stop(self):
+        self.running = False
+        self.wait()
+
+# ======================
+# UART 전용 스레드
+# ======================
+class UARTThread(QThread):
+    # (판정 문자, 바이트를 읽은 시각 perf_counter)
+    data_signal = pyqtSignal(str, float)
+    # 프레임 프로토콜의 seq/tick/좌표까지 담은 UartEvent
+    event_signal = pyqtSignal(object)
+    status_signal = pyqtSignal(str)
+
+    def __init__(self, port='COM10', baudrate=9600, legacy=LEGACY_AUTO):
+        super().__init__()
+        # 포트 경로 또는 후보 목록 ('usb:VID:PID', 'name:...', 'COM10' ...)
+        self.port = port
+        self.baudrate = baudrate
+        # 레거시 단일 문자 해석 ('auto' / 'on' / 'off', uart_link 참고)
+        self.legacy = legacy
+        self.running = True
+        self.ser = None
+        self.device = None
+        self.connected = False
+        self.health = LinkHealth()
+
+    def run(self):
+        # 연결 -> 읽기 -> (케이블 빠짐 등 예외) -> 대기 후 다시 연결, stop() 까지 반복
+        backoff = RECONNECT_MIN_SECONDS
+        while self.running:
+            if not self._open():
+                _sleep_while_running(self, backoff)
+                backoff = min(backoff * 2, RECONNECT_MAX_SECONDS)
+                continue
+            backoff = RECONNECT_MIN_SECONDS
+            try:
+                self._read_loop()
+            except Exception as e:
+                self.status_signal.emit(f"UART 끊김: {e}")
+            finally:
+                self._close()
+            if self.running:
+                self.health.down()
+
+    def _open(self):
+        t_open = time.perf_counter()
+        try:
+            port = find_serial_port(self.port)
+            if port is None:
+                raise serial.SerialException(f"일치하는 포트 없음 ({self.port})")
+            # 읽기/쓰기 모두 타임아웃: 케이블이 빠져도 루프가 running/재연결을 곧 확인
+            self.ser = serial.Serial(port, self.baudrate, timeout=0.1, write_timeout=0.5)
+        except Exception as e:
+            if self.health.fail():
+                self.status_signal.emit(f"UART 연결 실패: {e} (다시 시도 중)")
+            return False
+        outage = self.health.up(time.perf_counter() - t_open)
+        self.device = port
+        self.connected = True
+        startup.mark('uart_connected')
+        if outage is None:
+            self.status_signal.emit(f"UART 연결됨 ({port})")
+        else:
+            self.status_signal.emit(f"UART 다시 연결됨 ({port}, 끊김 {outage:.1f}s)")
+        return True
+
+    def _read_loop(self):
+        # 연결마다 새 디코더 (끊기기 전의 반쪽 프레임은 버림)
+        decoder = CallDecoder(legacy=self.legacy)
+        while self.running:
+            # 1바이트 이상 올 때까지 블록(timeout 0.1s), 도착한 만큼 한 번에 읽음
+            chunk = self.ser.read(self.ser.in_waiting or 1)
+            if not chunk:
+                continue
+            t_read = time.perf_counter()
+            events = decoder.feed(chunk, t_read)
+            if tracer.enabled:
+                tracer.span('decode', t_read, thread='uart', size=len(chunk))
+            for event in events:
+                self.data_signal.emit(event.kind, t_read)
+                self.event_signal.emit(event)
+
+    def _close(self):
+        self.connected = False
+        if self.ser and self.ser.is_open:
+            try:
+                self.ser.close()
+            except:
+                pass
+
+    def stop(self):
+        self.running = False
+        self.wait()
+
+    def send_data(self, data):
+        if self.ser and self.ser.is_open:
+            try:
+                self.ser.write(data.encode('utf-8'))
+                self.status_signal.emit(f"데이터 전송 성공: {data}")
+            except Exception as e:
+                self.status_signal.emit(f"데이터 전송 실패: {e}")
+
+
+# ======================
+# 공유 입출력 코어
+# ======================
+class IOCore(QObject):
+    """카메라 스레드(CaptureManager), UART 스레드, 소프트웨어 판정, 클립 녹화를 소유.
+
+    화면은 data_signal / event_signal / status_signal 에 연결했다가 다른
+    화면으로 넘어갈 때 끊는다. 장치는 start() 한 번, stop() 한 번뿐이다.
+    """
+    data_signal = pyqtSignal(str, float)
+    event_signal = pyqtSignal(object)
+    status_signal = pyqtSignal(str)
+
+    def __init__(self, camera_sources, port, baudrate=9600, soft_judge=False, clip_dir=None,
+                 frame_size=None, capture_profile=None, uart_legacy=LEGACY_AUTO, parent=None):
+        super().__init__(parent)
+        self.camera_sources = camera_sources
+        # CaptureProfile 인자 dict (설정 파일은 cv2 를 import 하지 않도록 dict 로 둠)
+        self.capture_profile = capture_profile
+        # 경기 화면 영상 크기: 인트로 동안 받는 프레임도 미리 이 크기로 축소
+        self.frame_size = frame_size
+        self.port = port
+        self.baudrate = baudrate
+        self.uart_legacy = uart_legacy
+        self.soft_judge = soft_judge
+        self.clip_dir = clip_dir
+        self.threads = []
+        self.video = None
+        self.uart = None
+        self.judge = None
+        self.clips = None
+        self.status_history = deque(maxlen=STATUS_HISTORY)
+        self.status_signal.connect(self.status_history.append)
+        self.supervisor = QTimer(self)
+        self.supervisor.timeout.connect(self._supervise)
+
+    @property
+    def connected(self):
+        """FPGA 와 UART 가 연결되어 있는지."""
+        return self.uart is not None and self.uart.connected
+
+    def start(self):
+        if self.video is not None:
+            return
+        # 카메라마다 별도 스레드 (video 는 전체를 묶은 CaptureManager)
+        profile = CaptureProfile(**self.capture_profile) if self.capture_profile else None
+        self.threads = [VideoThread(camera_index=index, name=name, profile=profile)
+                        for name, index in self.camera_sources]
+        for thread in self.threads:
+            thread.status_signal.connect(self.status_signal)
+        self.video = CaptureManager(self.threads)
+        if self.frame_size:
+            width, height = self.frame_size
+            self.threads[0].converter.set_target(width, height)
+            if len(self.threads) > 1:
+                inset = pip_rect(QRect(0, 0, width, height))
+                for thread in self.threads[1:]:
+                    thread.converter.set_target(inset.width(), inset.height())
+        if self.soft_judge:
+            # 메인 카메라 프레임을 작업 프로세스로 넘김 (GUI 스레드와 무관)
+            self.judge = SoftJudge()
+            self.judge.start()
+            self.threads[0].judge = self.judge
+        if self.clip_dir:
+            self.clips = ClipRecorder(self.clip_dir)
+            self.threads[0].recorder = self.clips
+        self.video.start()
+
+        self.uart = UARTThread(port=self.port, baudrate=self.baudrate, legacy=self.uart_legacy)
+        self.uart.data_signal.connect(self.data_signal)
+        self.uart.event_signal.connect(self.event_signal)
+        self.uart.status_signal.connect(self.status_signal)
+        self.uart.start()
+        self.supervisor.start(SUPERVISE_INTERVAL_MS)
+
+    def _supervise(self):
+        """스레드 스스로 못 잡는 경우 처리: 오래 멈춘 카메라는 다시 열고, 끝난 스레드는 재시작."""
+        now = time.monotonic()
+        for thread in self.threads:
+            if thread.running and not thread.isRunning():
+                self.status_signal.emit(f"{thread.name} 캡처 스레드 재시작".strip())
+                thread.start()
+            elif (thread.health.connected and not thread.reconnect and thread.last_frame is not None
+                  and now - thread.last_frame > FIRST_FRAME_TIMEOUT_SECONDS + STALL_SECONDS):
+                self.status_signal.emit(f"{thread.name} 영상 멈춤 감지, 다시 연결".strip())
+                thread.interrupt()
+        if self.uart.running and not self.uart.isRunning():
+            self.status_signal.emit("UART 스레드 재시작")
+            self.uart.start()
+
+    def health(self):
+        """장치별 연결/끊김 지표 {이름: LinkHealth.stats()}."""
+        report = {thread.name or str(thread.camera_index): thread.health.stats() for thread in self.threads}
+        if self.uart is not None:
+            report['UART'] = self.uart.health.stats()
+        return report
+
+    def first_frame_seconds(self):
+        """메인 카메라를 열기 시작해 첫 프레임을 받기까지 (초). 아직이면 None."""
+        return self.threads[0].first_frame_seconds if self.threads else None
+
+    def send(self, data):
+        if self.uart is not None:
+            self.uart.send_data(data)
+
+    def stop(self):
+        self.supervisor.stop()
+        if self.video is not None:
+            print(f"장치 연결 상태 {self.health()}")
+            self.video.stop()
+        if self.judge is not None:
+            self.judge.stop()
+            print(f"소프트웨어 판정 {self.judge.stats()}")
+        if self.clips is not None:
+            self.clips.close()
+            print(f"판정 클립 {self.clips.stats()}")
+        if self.uart is not None and self.uart.isRunning():
+            self.uart.stop()
+        self.video = None
+        self.judge = None
+        self.clips = None
@@ -0,0 +1,215 @@
+"""ChromaKey_Detector / RGB_to_HSV 의 비트 단위 소프트웨어 모델 (NumPy).
+
+FPGA(system_verilog_basys/front) 와 같은 입력을 만들기 위해 프레임을 OV7670
+프레임 버퍼와 같은 320x240 RGB565 로 바꾸고, VGA_MemController 처럼 2배
+확대된 640x480 화면의 y=240 줄을 훑는다.
+
+    python abs_model.py pitch.mp4                 # 프레임별 chr_min_x / chr_max_x
+    python abs_model.py pitch.mp4 --r-margin 3 --b-margin 1 --quiet
+
+ChromaKey_Detector 의 en 입력(FSM 이 ONE 상태일 때만 1)은 항상 1 로 본다.
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+
+FB_WIDTH, FB_HEIGHT = 320, 240      # 프레임 버퍼 (QVGA)
+VGA_WIDTH = 640                     # x_pixel 범위
+SCAN_Y = 240                        # ChromaKey_Detector 가 보는 줄
+CHR_R_MARGIN = 2                    # (g + 1) > r + 2
+CHR_B_MARGIN = 2                    # (g + 1) >= b + 2
+CHR_DEBOUNCE = 5                    # chr_cnt == 5
+
+
+# ======================
+# 픽셀 형식
+# ======================
+def rgb888_to_rgb565(rgb):
+    """(..., 3) uint8 RGB -> uint16 RGB565 (OV7670 출력 형식)."""
+    rgb = np.asarray(rgb, dtype=np.uint16)
+    return ((rgb[..., 0] >> 3) << 11) | ((rgb[..., 1] >> 2) << 5) | (rgb[..., 2] >> 3)
+
+
+def vga_channels(rgb565):
+    """VGA_MemController 의 reg_r / reg_g / reg_b (4비트).
+
+    r, g 는 0 이나 15 가 아니면 1을 뺀다 (출력 밝기 보정).
+    """
+    rgb565 = np.asarray(rgb565, dtype=np.uint16)
+    r = ((rgb565 >> 12) & 0xF).astype(np.int16)
+    g = ((rgb565 >> 7) & 0xF).astype(np.int16)
+    b = ((rgb565 >> 1) & 0xF).astype(np.int16)
+    r = np.where((r == 0xF) | (r == 0), r, r - 1)
+    g = np.where((g == 0xF) | (g == 0), g, g - 1)
+    return r, g, b
+
+
+# ======================
+# RGB_to_HSV
+# ======================
+def rgb565_to_hsv(rgb565):
+    """RGB_to_HSV 모듈과 같은 정수 연산으로 (h_out, s_out, v_out) 계산.
+
+    h_temp 는 부호 없는 32비트 문맥에서 계산된 뒤 12비트, h_out 은 10비트로
+    잘리므로 (g - b) 가 음수인 경우의 랩어라운드까지 그대로 재현한다.
+    """
+    rgb565 = np.asarray(rgb565, dtype=np.uint16)
+    r = (((rgb565 >> 11) & 0x1F) << 1).astype(np.int64)   # {r5, 0}
+    g = ((rgb565 >> 5) & 0x3F).astype(np.int64)           # g6
+    b = ((rgb565 & 0x1F) << 1).astype(np.int64)           # {b5, 0}
+
+    max_val = np.where(r > g, np.where(r > b, r, b), np.where(g > b, g, b))
+    min_val = np.where(r < g, np.where(r < b, r, b), np.where(g < b, g, b))
+    delta = max_val - min_val
+
+    v_out = (max_val * 100) // 63
+    s_out = np.where(max_val == 0, 0, (delta * 100) // np.maximum(max_val, 1)) & 0x7F
+
+    mask32 = 0xFFFFFFFF
+    safe_delta = np.maximum(delta, 1)
+    h_r = ((60 * ((g - b) & mask32)) & mask32) // safe_delta
+    h_g = (((60 * ((b - r) & mask32)) & mask32) // safe_delta + 120) & mask32
+    h_b = (((60 * ((r - g) & mask32)) & mask32) // safe_delta + 240) & mask32
+    h_temp = np.where(delta == 0, 0,
+                      np.where(max_val == r, h_r,
+                               np.where(max_val == g, h_g, h_b))) & 0xFFF
+    h_out = h_temp & 0x3FF
+    return h_out.astype(np.uint16), s_out.astype(np.uint8), v_out.astype(np.uint8)
+
+
+# ======================
+# ChromaKey_Detector
+# ======================
+def chroma_mask(r, g, b, r_margin=CHR_R_MARGIN, b_margin=CHR_B_MARGIN):
+    """초록 판정: (g + 1) > r + r_margin && (g + 1) >= b + b_margin."""
+    return ((g + 1) > (r + r_margin)) & ((g + 1) >= (b + b_margin))
+
+
+class ChromaKeyDetector:
+    """ChromaKey_Detector 의 레지스터(chr_cnt, reg_min_x, reg_max_x)를 프레임 사이에 유지.
+
+    한 줄의 동작을 벡터로 계산한다: 초록 구간 안에서 chr_cnt 가 debounce 에
+    도달한 다음 픽셀부터 cnt_flag 가 켜지고, 그 첫 픽셀이 min_x, 마지막
+    픽셀이 max_x 가 된다 (켜진 픽셀이 두 개 이상일 때만 max_x 갱신).
+    검출이 없으면 이전 프레임 값이 그대로 남는 것도 하드웨어와 같다.
+    """
+
+    def __init__(self, r_margin=CHR_R_MARGIN, b_margin=CHR_B_MARGIN, debounce=CHR_DEBOUNCE):
+        self.r_margin = r_margin
+        self.b_margin = b_margin
+        self.period = debounce + 1
+        self.chr_cnt = 0
+        self.min_x = 0
+        self.max_x = 0
+        self._idx = np.arange(VGA_WIDTH)
+
+    def reset(self):
+        self.chr_cnt = 0
+        self.min_x = 0
+        self.max_x = 0
+
+    def scan_line(self, green):
+        """y=240 줄의 초록 여부(640 bool)로 레지스터 갱신. (min_x, max_x) 반환."""
+        idx = self._idx
+        prev = np.empty_like(green)
+        prev[0] = False
+        prev[1:] = green[:-1]
+        starts = np.where(green & ~prev, idx, -1)
+        run_start = np.maximum.accumulate(starts)
+        k = idx - run_start
+        # 줄 맨 앞에서 시작하는 구간만 이전 프레임의 chr_cnt 를 이어받음
+        carry = np.where(run_start == 0, self.chr_cnt, 0)
+        armed = green & (k >= self.period - carry)
+
+        hits = np.flatnonzero(armed)
+        if hits.size:
+            self.min_x = int(hits[0])
+            if hits.size > 1:
+                self.max_x = int(hits[-1])
+
+        if green[-1]:
+            self.chr_cnt = int((carry[-1] + k[-1] + 1) % self.period)
+        else:
+            self.chr_cnt = 0
+        return self.min_x, self.max_x
+
+    def process_rgb565(self, frame565):
+        """320x240 RGB565 프레임 버퍼 하나를 처리."""
+        line = np.empty(VGA_WIDTH, dtype=frame565.dtype)
+        # frame_buffer 의 rData 는 rAddr 다음 클럭에 나오므로 (registered read)
+        # x 픽셀은 x-1 의 주소 값을 본다. x=0 은 blanking 동안 oe=0 으로 유지된
+        # 윗줄(y-1)의 마지막 값
+        line[1:] = np.repeat(frame565[SCAN_Y // 2], 2)[:VGA_WIDTH - 1]   # rAddr = (y/2)*320 + x/2
+        line[0] = frame565[(SCAN_Y - 1) // 2, FB_WIDTH - 1]
+        r, g, b = vga_channels(line)
+        return self.scan_line(chroma_mask(r, g, b, self.r_margin, self.b_margin))
+
+    def process_rgb(self, rgb):
+        """임의 크기 RGB888 프레임 (카메라/동영상). 320x240 으로 맞춘 뒤 처리."""
+        return self.process_rgb565(rgb888_to_rgb565(fit_framebuffer(rgb)))
+
+
+def fit_framebuffer(rgb):
+    """OV7670 프레임 버퍼 크기(320x240)로 최근접 축소."""
+    h, w = rgb.shape[:2]
+    if (w, h) == (FB_WIDTH, FB_HEIGHT):
+        return rgb
+    ys = (np.arange(FB_HEIGHT) * h) // FB_HEIGHT
+    xs = (np.arange(FB_WIDTH) * w) // FB_WIDTH
+    return rgb[ys[:, None], xs[None, :]]
+
+
+def scan_video(path, detector=None, hsv=False):
+    """동영상의 프레임마다 (프레임 번호, min_x, max_x[, (h, s, v)]) 를 생성."""
+    import cv2
+
+    detector = detector or ChromaKeyDetector()
+    cap = cv2.VideoCapture(path)
+    if not cap.isOpened():
+        raise IOError(f"'{path}' 를 열 수 없습니다.")
+    frame = None
+    index = 0
+    try:
+        while True:
+            ret, frame = cap.read(frame)
+            if not ret:
+                break
+            rgb = cv2.cvtColor(fit_framebuffer(frame), cv2.COLOR_BGR2RGB)
+            frame565 = rgb888_to_rgb565(rgb)
+            min_x, max_x = detector.process_rgb565(frame565)
+            if hsv:
+                yield index, min_x, max_x, rgb565_to_hsv(frame565)
+            else:
+                yield index, min_x, max_x
+            index += 1
+    finally:
+        cap.release()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='ChromaKey_Detector 소프트웨어 모델')
+    parser.add_argument('video')
+    parser.add_argument('--r-margin', type=int, default=CHR_R_MARGIN)
+    parser.add_argument('--b-margin', type=int, default=CHR_B_MARGIN)
+    parser.add_argument('--debounce', type=int, default=CHR_DEBOUNCE)
+    parser.add_argument('--quiet', action='store_true', help='프레임별 출력 없이 요약만')
+    args = parser.parse_args(argv)
+
+    detector = ChromaKeyDetector(args.r_margin, args.b_margin, args.debounce)
+    t0 = time.perf_counter()
+    frames = 0
+    last = None
+    for index, min_x, max_x in scan_video(args.video, detector):
+        frames += 1
+        if not args.quiet and (min_x, max_x) != last:
+            print(f"frame {index:6d}  chr_min_x={min_x:3d}  chr_max_x={max_x:3d}")
+        last = (min_x, max_x)
+    elapsed = time.perf_counter() - t0
+    print(f"{frames} frames  {frames / elapsed if elapsed else 0:.0f} FPS")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
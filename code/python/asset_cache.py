@@ -0,0 +1,98 @@
+from collections import OrderedDict
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QImage, QPixmap
+
+# 시작할 때 미리 디코딩해 두는 이미지
+PRELOAD_IMAGES = (
+    'baseball.jpg',
+    'font_strike.png',
+    'font_ball.png',
+    'font_out.png',
+    'crack_effect.png',
+    'any_key.png',
+    'label_mode1.png',
+    'label_mode2.png',
+    'intro_last_frame.png',
+)
+
+
+# ======================
+# 이미지 캐시
+# ======================
+class AssetCache:
+    """이미지를 파일당 한 번만 디코딩하고, 크기별 스케일 결과를 LRU 로 보관.
+
+    QPixmap 은 GUI 스레드 전용이므로 QApplication 생성 뒤 GUI 스레드에서만
+    사용한다. 파일 디코딩만 먼저 끝내 두려면 다른 스레드에서 load_images()로
+    QImage 를 읽고 GUI 스레드에서 adopt()로 넘긴다.
+    """
+
+    def __init__(self, max_scaled=32):
+        self.max_scaled = max_scaled
+        self._originals = {}
+        self._scaled = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def preload(self, names=PRELOAD_IMAGES):
+        for name in names:
+            self.pixmap(name)
+
+    def adopt(self, images):
+        """load_images() 결과를 QPixmap 으로 변환해 보관 (GUI 스레드)."""
+        for name, image in images.items():
+            if name not in self._originals:
+                self._originals[name] = QPixmap.fromImage(image)
+
+    def pixmap(self, name):
+        """원본 QPixmap. 파일이 없으면 null pixmap (QPixmap(name) 과 동일)."""
+        if name in self._originals:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return self._original(name)
+
+    def _original(self, name):
+        """hits/misses 를 세지 않는 원본 조회 (scaled() 의 미스는 한 번만 셈)."""
+        pixmap = self._originals.get(name)
+        if pixmap is None:
+            pixmap = QPixmap(name)
+            self._originals[name] = pixmap
+        return pixmap
+
+    def scaled(self, name, width, height, aspect=Qt.IgnoreAspectRatio, mode=Qt.SmoothTransformation):
+        key = (name, width, height, aspect, mode)
+        pixmap = self._scaled.get(key)
+        if pixmap is not None:
+            self._scaled.move_to_end(key)
+            self.hits += 1
+            return pixmap
+        self.misses += 1
+        original = self._original(name)
+        pixmap = original if original.isNull() else original.scaled(width, height, aspect, mode)
+        self._scaled[key] = pixmap
+        if len(self._scaled) > self.max_scaled:
+            self._scaled.popitem(last=False)
+        return pixmap
+
+    def clear(self):
+        self._originals.clear()
+        self._scaled.clear()
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'originals': len(self._originals),
+            'scaled': len(self._scaled),
+        }
+
+
+def load_images(names=PRELOAD_IMAGES):
+    """{이름: QImage}. QImage 는 스레드 안전하므로 백그라운드에서 디코딩 가능."""
+    return {name: QImage(name) for name in names}
+
+
+# 프로세스 전체에서 공유
+assets = AssetCache()
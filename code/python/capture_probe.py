@@ -0,0 +1,145 @@
+"""카메라 캡처 형식별 실제 FPS / 지연 측정.
+
+OpenCV 는 장치가 지원하는 형식 목록을 주지 않으므로 후보 형식을 하나씩
+요청해 보고, 장치가 그대로 받아들인 형식만 측정한다 (--all 이면 전부).
+
+    python capture_probe.py 1
+    python capture_probe.py usb:046d:0825 --frames 300
+    python capture_probe.py 1 --modes 640x480@30:MJPG 1280x720@30:YUY2
+
+열 설명
+    first   장치를 연 뒤 첫 프레임까지 (DirectShow 협상 포함)
+    fps     실제로 받은 프레임 수 / 시간
+    p50/p99 프레임 간격
+    queue   잠깐 쉬었다 연속으로 read() 할 때 기다리지 않고 돌아온 횟수 (평균).
+            드라이버 큐에 쌓여 있던 프레임 수이므로 buffer_size=1 을 지키는
+            장치는 1, 지키지 않으면 4~5 처럼 크게 나온다.
+    age     queue x 프레임 간격. 쉬었다 읽은 첫 프레임이 최대 이만큼 오래된 것
+            (큐의 프레임을 다 비워야 최신 프레임이 나옴)
+"""
+import argparse
+import sys
+import time
+
+from device_discovery import resolve_camera
+from video_sources import CameraSource, CaptureProfile, profile_mismatches
+
+CANDIDATE_SIZES = [(640, 480), (800, 600), (1280, 720), (1920, 1080)]
+CANDIDATE_FPS = [30, 60]
+CANDIDATE_FOURCC = ['MJPG', 'YUY2']
+WARMUP_FRAMES = 10
+IDLE_ROUNDS = 10
+IDLE_SECONDS = 0.2
+MAX_QUEUE = 10
+
+
+def parse_mode(text):
+    """'640x480@30:MJPG' -> CaptureProfile"""
+    size, _, rest = text.partition('@')
+    fps, _, fourcc = rest.partition(':')
+    width, height = (int(v) for v in size.lower().split('x'))
+    return CaptureProfile(width, height, int(fps) if fps else None, fourcc or None)
+
+
+def candidate_modes():
+    return [CaptureProfile(w, h, fps, fourcc)
+            for fourcc in CANDIDATE_FOURCC for (w, h) in CANDIDATE_SIZES for fps in CANDIDATE_FPS]
+
+
+def _percentile(values, p):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+
+def probe(index, profile, frames, require_match=True):
+    """형식 하나 측정. 열리지 않으면 None, require_match 인데 다르게 잡히면 측정 없이 반환."""
+    t_open = time.perf_counter()
+    source = CameraSource(index, profile=profile)
+    if not source.isOpened():
+        return None
+    try:
+        result = {'mode': source.mode(), 'mismatches': profile_mismatches(source.negotiated)}
+        if require_match and result['mismatches']:
+            return result
+        frame = None
+        ret, frame = source.read(frame)
+        if not ret:
+            result['error'] = '프레임 없음'
+            return result
+        result['first_ms'] = (time.perf_counter() - t_open) * 1000
+        for _ in range(WARMUP_FRAMES):
+            ret, frame = source.read(frame)
+
+        intervals = []
+        start = last = time.perf_counter()
+        for _ in range(frames):
+            ret, frame = source.read(frame)
+            if not ret:
+                break
+            now = time.perf_counter()
+            intervals.append(now - last)
+            last = now
+        result['fps'] = len(intervals) / (last - start) if last > start else 0.0
+        result['p50_ms'] = _percentile(intervals, 50) * 1000
+        result['p99_ms'] = _percentile(intervals, 99) * 1000
+
+        # 쉬는 동안 큐에 쌓인 프레임은 read() 가 기다리지 않고 바로 돌려준다.
+        # 큐가 빌 때까지(한 번 기다릴 때까지) 센 수가 큐 깊이
+        period = 1.0 / result['fps'] if result['fps'] else 0.0
+        depths = []
+        for _ in range(IDLE_ROUNDS):
+            time.sleep(IDLE_SECONDS)
+            depth = 0
+            while depth < MAX_QUEUE:
+                t = time.perf_counter()
+                ret, frame = source.read(frame)
+                if not ret or time.perf_counter() - t >= period * 0.25:
+                    break
+                depth += 1
+            depths.append(depth)
+        result['queue'] = sum(depths) / len(depths)
+        result['age_ms'] = result['queue'] * period * 1000
+        return result
+    finally:
+        source.release()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='카메라 캡처 형식별 FPS / 지연 측정')
+    parser.add_argument('camera', help="카메라 번호, 'usb:VID:PID' 또는 'name:이름'")
+    parser.add_argument('--modes', nargs='*', type=parse_mode, default=None, help='WxH@fps:FOURCC (기본: 후보 전부)')
+    parser.add_argument('--frames', type=int, default=150)
+    parser.add_argument('--all', action='store_true', help='장치가 다르게 잡은 형식도 측정')
+    args = parser.parse_args(argv)
+
+    index = resolve_camera(int(args.camera) if args.camera.isdigit() else args.camera)
+    if index is None:
+        print(f"카메라를 찾을 수 없습니다: {args.camera}")
+        return 1
+    print(f"{'requested':>20} {'actual':>22} {'first':>8} {'fps':>7} {'p50':>8} {'p99':>8} {'queue':>6} {'age':>8}")
+    measured = set()
+    for profile in args.modes or candidate_modes():
+        result = probe(index, profile, args.frames, require_match=not args.all)
+        if result is None:
+            print(f"카메라를 열 수 없습니다: {index}")
+            return 1
+        if result['mismatches'] and not args.all:
+            continue
+        # 요청이 달라도 같은 형식으로 잡히면 한 번만
+        if result['mode'] in measured:
+            continue
+        measured.add(result['mode'])
+        if 'error' in result:
+            print(f"{profile!r:>20} {result['mode']:>22}  {result['error']}")
+            continue
+        print(f"{profile!r:>20} {result['mode']:>22} {result['first_ms']:6.0f}ms {result['fps']:7.1f} "
+              f"{result['p50_ms']:6.1f}ms {result['p99_ms']:6.1f}ms {result['queue']:6.1f} {result['age_ms']:6.0f}ms")
+    if not measured:
+        print("장치가 받아들인 후보 형식이 없습니다 (--all 로 실제 잡힌 형식 확인).")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
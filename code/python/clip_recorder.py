@@ -0,0 +1,311 @@
+"""판정 순간 전후 영상 클립 저장 (FPGA Frame_2s_Stop 의 PC 버전).
+
+VideoThread 는 프레임을 작은 버퍼 풀에 복사해 넘기기만 하고, 인코딩 스레드가
+JPEG 로 압축해 메모리 상한이 있는 링에 넣는다. 'S' / 'B' 가 오면 trigger()로
+판정 전 pre 초 ~ 후 post 초 구간을 잘라 쓰기 스레드에 넘긴다. 캡처 스레드는
+JPEG 압축도 파일 I/O 도 기다리지 않는다 (인코딩이 밀리면 녹화 프레임만 버림).
+
+링이 바이트 상한 때문에 pre 초를 다 담지 못했거나 프레임이 버려져 구간 앞이
+비면 truncated 로 세고 로그를 남긴다. 저장 폴더에는 최근 max_clips 개 /
+max_clip_bytes 까지만 남기고 오래된 클립부터 지운다.
+
+클립 파일(.absclip): 헤더 뒤에 (프레임 시각 f64, 길이 u32, JPEG 바이트) 반복.
+
+    python clip_recorder.py info clips/pitch_20250101_120000_123_S.absclip
+    python clip_recorder.py export clips/pitch_...absclip pitch.avi
+"""
+import argparse
+import collections
+import os
+import queue
+import struct
+import sys
+import threading
+import time
+
+import cv2
+import numpy as np
+
+CLIP_MAGIC = b'ABSCLIP1'
+CLIP_PREFIX = 'pitch_'
+CLIP_SUFFIX = '.absclip'
+_HEADER = struct.Struct('<dd1s')     # 판정 시각(벽시계), 판정 시각(monotonic), 판정 문자
+_RECORD = struct.Struct('<dI')
+
+PRE_SECONDS = 1.5
+POST_SECONDS = 0.5
+JPEG_QUALITY = 80
+RING_MAX_BYTES = 32 * 1024 * 1024   # JPEG 기준 (720p q80 약 100KiB -> 30fps 로 10초 이상)
+ENCODE_SLOTS = 4                    # 캡처 -> 인코딩 스레드 원본 버퍼 수
+TRUNCATE_TOLERANCE = 0.1            # 구간 앞이 이보다 더 비면 잘린 클립 (초)
+MAX_CLIPS = 200                     # 저장 폴더에 남길 클립 수
+MAX_CLIP_BYTES = 512 * 1024 * 1024  # 저장 폴더에 남길 총 크기
+
+
+class JpegRing:
+    """(monotonic 시각, JPEG) 를 시간(seconds)과 총 바이트(max_bytes) 둘 다로 제한해 보관."""
+
+    def __init__(self, seconds, max_bytes=RING_MAX_BYTES):
+        self.seconds = seconds
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.evicted = 0
+        self.trimmed = 0         # seconds 안인데 바이트 상한 때문에 밀려난 프레임
+        self._frames = collections.deque()
+        self._lock = threading.Lock()
+
+    def push(self, timestamp, data):
+        with self._lock:
+            self._frames.append((timestamp, data))
+            self.nbytes += len(data)
+            frames = self._frames
+            while frames and (self.nbytes > self.max_bytes or timestamp - frames[0][0] > self.seconds):
+                old_timestamp, old = frames.popleft()
+                self.nbytes -= len(old)
+                self.evicted += 1
+                if timestamp - old_timestamp <= self.seconds:
+                    self.trimmed += 1
+
+    def window(self, t_start, t_end):
+        """t_start <= 시각 <= t_end 인 프레임 목록 (복사본)."""
+        with self._lock:
+            return [(ts, data) for ts, data in self._frames if t_start <= ts <= t_end]
+
+    def __len__(self):
+        return len(self._frames)
+
+
+class ClipRecorder:
+    """push_frame()은 캡처 스레드, trigger()는 GUI 스레드에서 호출."""
+
+    def __init__(self, directory='clips', pre=PRE_SECONDS, post=POST_SECONDS,
+                 quality=JPEG_QUALITY, max_bytes=RING_MAX_BYTES,
+                 max_clips=MAX_CLIPS, max_clip_bytes=MAX_CLIP_BYTES):
+        self.directory = directory
+        self.pre = pre
+        self.post = post
+        self.max_clips = max_clips
+        self.max_clip_bytes = max_clip_bytes
+        self.ring = JpegRing(pre + post + 0.5, max_bytes)
+        self.latest_path = None
+        self.clips_written = 0
+        self.clips_pruned = 0
+        self.clips_truncated = 0
+        self.encode_failures = 0
+        self.frames_dropped = 0       # 인코딩이 밀려 녹화하지 못한 프레임
+        self._params = [int(cv2.IMWRITE_JPEG_QUALITY), quality]
+        self._pending = []            # [(판정 문자, monotonic 시각)]
+        self._pending_lock = threading.Lock()
+        self._free = queue.Queue()    # 인코딩이 끝나 다시 쓸 수 있는 원본 버퍼
+        self._allocated = 0
+        self._raw = queue.Queue()     # (시각, 원본 버퍼) -> 인코딩 스레드
+        self._jobs = queue.Queue()
+        self._encoder = threading.Thread(target=self._encode_loop, name='clip-encoder', daemon=True)
+        self._writer = threading.Thread(target=self._write_loop, name='clip-writer', daemon=True)
+        os.makedirs(directory, exist_ok=True)
+        self._encoder.start()
+        self._writer.start()
+
+    # ======================
+    # 캡처 스레드
+    # ======================
+    def push_frame(self, bgr, timestamp=None):
+        """원본 버퍼에 복사해 인코딩 스레드로 넘긴다. 빈 버퍼가 없으면 이 프레임은 버림."""
+        if timestamp is None:
+            timestamp = time.monotonic()
+        try:
+            buffer = self._free.get_nowait()
+        except queue.Empty:
+            if self._allocated >= ENCODE_SLOTS:
+                self.frames_dropped += 1
+                return
+            self._allocated += 1
+            buffer = None
+        if buffer is None or buffer.shape != bgr.shape or buffer.dtype != bgr.dtype:
+            buffer = np.empty_like(bgr)
+        np.copyto(buffer, bgr)
+        self._raw.put((timestamp, buffer))
+
+    # ======================
+    # 인코딩 스레드
+    # ======================
+    def _encode_loop(self):
+        while True:
+            item = self._raw.get()
+            if item is None:
+                break
+            timestamp, buffer = item
+            ok, data = cv2.imencode('.jpg', buffer, self._params)
+            self._free.put(buffer)
+            if ok:
+                self.ring.push(timestamp, data)
+            else:
+                self.encode_failures += 1
+            if self._pending:
+                self._flush_ready(timestamp)
+
+    def _flush_ready(self, now):
+        with self._pending_lock:
+            ready = [item for item in self._pending if now >= item[1] + self.post]
+            if not ready:
+                return
+            self._pending = [item for item in self._pending if now < item[1] + self.post]
+        for kind, t_event in ready:
+            frames = self.ring.window(t_event - self.pre, t_event + self.post)
+            if not frames or frames[0][0] - (t_event - self.pre) > TRUNCATE_TOLERANCE:
+                self.clips_truncated += 1
+                covered = t_event - frames[0][0] if frames else 0.0
+                print(f"판정 클립 앞부분 잘림: {kind} 판정 전 {covered:.2f}/{self.pre:.2f}s "
+                      f"(링 {self.ring.nbytes // 1024}KiB, 바이트 상한으로 밀린 프레임 {self.ring.trimmed}, "
+                      f"인코딩 밀려 버린 프레임 {self.frames_dropped})")
+            self._jobs.put((kind, t_event, frames))
+
+    # ======================
+    # GUI 스레드
+    # ======================
+    def trigger(self, kind, timestamp=None):
+        """판정 시각 기준 클립 예약. 판정 후 post 초 분량이 모이면 저장된다."""
+        with self._pending_lock:
+            self._pending.append((kind, time.monotonic() if timestamp is None else timestamp))
+
+    def close(self):
+        """남은 예약은 지금까지 모인 프레임으로 저장하고 인코딩/쓰기 스레드 종료."""
+        self._raw.put(None)
+        self._encoder.join()
+        self._flush_ready(float('inf'))
+        self._jobs.put(None)
+        self._writer.join()
+
+    def stats(self):
+        return {
+            'ring_frames': len(self.ring),
+            'ring_kib': self.ring.nbytes // 1024,
+            'clips': self.clips_written,
+            'truncated': self.clips_truncated,
+            'dropped_frames': self.frames_dropped,
+            'pruned': self.clips_pruned,
+            'pending': len(self._pending),
+            'queued': self._jobs.qsize(),
+        }
+
+    # ======================
+    # 쓰기 스레드
+    # ======================
+    def _write_loop(self):
+        self._prune()
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            kind, t_event, frames = job
+            if not frames:
+                continue
+            wall = time.time() - (time.monotonic() - t_event)
+            stamp = time.strftime('%Y%m%d_%H%M%S', time.localtime(wall)) + f"_{int(wall * 1000) % 1000:03d}"
+            path = os.path.join(self.directory, f"{CLIP_PREFIX}{stamp}_{kind}{CLIP_SUFFIX}")
+            try:
+                write_clip(path, kind, wall, t_event, frames)
+            except OSError as e:
+                print(f"클립 저장 실패: {e}")
+                continue
+            self.latest_path = path
+            self.clips_written += 1
+            self._prune()
+
+    def _prune(self):
+        """오래된 클립부터 지워 max_clips 개 / max_clip_bytes 이하로 유지 (파일 이름 = 시각 순)."""
+        try:
+            clips = sorted((entry.name, entry.stat().st_size) for entry in os.scandir(self.directory)
+                           if entry.name.startswith(CLIP_PREFIX) and entry.name.endswith(CLIP_SUFFIX))
+        except OSError:
+            return
+        total = sum(size for _, size in clips)
+        count = len(clips)
+        for name, size in clips:
+            if count <= self.max_clips and total <= self.max_clip_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            count -= 1
+            total -= size
+            self.clips_pruned += 1
+
+
+# ======================
+# 클립 파일
+# ======================
+def write_clip(path, kind, wall_time, t_event, frames):
+    tmp = path + '.part'
+    with open(tmp, 'wb') as f:
+        f.write(CLIP_MAGIC)
+        f.write(_HEADER.pack(wall_time, t_event, kind.encode('ascii')[:1]))
+        for timestamp, data in frames:
+            f.write(_RECORD.pack(timestamp - t_event, len(data)))
+            f.write(data)
+    os.replace(tmp, path)
+
+
+def load_clip(path):
+    """(판정 문자, 벽시계 시각, [(판정 기준 상대 시각, JPEG ndarray), ...])"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if not data.startswith(CLIP_MAGIC):
+        raise ValueError(f"'{path}' 는 클립 파일이 아닙니다.")
+    pos = len(CLIP_MAGIC)
+    wall_time, _, kind = _HEADER.unpack_from(data, pos)
+    pos += _HEADER.size
+    frames = []
+    while pos + _RECORD.size <= len(data):
+        offset, length = _RECORD.unpack_from(data, pos)
+        pos += _RECORD.size
+        frames.append((offset, np.frombuffer(data, dtype=np.uint8, count=length, offset=pos)))
+        pos += length
+    return kind.decode('ascii'), wall_time, frames
+
+
+def export_clip(path, out_path, fps=None):
+    """클립을 MJPG AVI 로 변환 (프레임 간격 평균으로 FPS 결정)."""
+    _, _, frames = load_clip(path)
+    if not frames:
+        return 0
+    if fps is None:
+        span = frames[-1][0] - frames[0][0]
+        fps = (len(frames) - 1) / span if span > 0 else 30.0
+    writer = None
+    for _, data in frames:
+        image = cv2.imdecode(data, cv2.IMREAD_COLOR)
+        if writer is None:
+            h, w = image.shape[:2]
+            writer = cv2.VideoWriter(out_path, cv2.VideoWriter_fourcc(*'MJPG'), fps, (w, h))
+        writer.write(image)
+    writer.release()
+    return len(frames)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='판정 클립 정보/변환')
+    sub = parser.add_subparsers(dest='command', required=True)
+    p = sub.add_parser('info')
+    p.add_argument('path')
+    p = sub.add_parser('export')
+    p.add_argument('path')
+    p.add_argument('out')
+    p.add_argument('--fps', type=float, default=None)
+    args = parser.parse_args(argv)
+
+    if args.command == 'info':
+        kind, wall_time, frames = load_clip(args.path)
+        size = sum(len(data) for _, data in frames)
+        span = frames[-1][0] - frames[0][0] if frames else 0.0
+        print(f"{kind}  {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(wall_time))}  "
+              f"{len(frames)} frames  {span:.2f}s  {size / 1024:.0f}KiB")
+    else:
+        count = export_clip(args.path, args.out, args.fps)
+        print(f"{count} frames -> {args.out}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""시리얼 포트 / 카메라 찾기 (USB VID:PID 또는 이름으로).
+
+장치 지정 문자열
+
+    'COM10', '/dev/ttyUSB1'   그대로 사용 (시리얼)
+    1, '1'                    카메라 번호 그대로 사용
+    'usb:0403:6010'           USB VID:PID (16진수) 가 같은 장치
+    'usb:0403:6010:1'         그 중 USB 인터페이스 번호가 1 인 포트 (FT2232 는 0=JTAG, 1=UART)
+    'sn:210183A8B1FF'         USB 시리얼 번호가 이 문자열로 시작하는 포트 (보드 한 대 고정)
+    'name:Digilent'           이름(설명/제조사)에 이 문자열이 들어간 장치
+
+USB 케이블을 다시 꽂으면 COM 번호나 카메라 번호가 바뀔 수 있으므로
+abs_core 는 연결할 때마다 이 모듈로 다시 찾는다.
+
+    python device_discovery.py            # 보이는 장치 목록
+"""
+import glob
+import os
+import sys
+
+USB_PREFIX = 'usb:'
+NAME_PREFIX = 'name:'
+SERIAL_PREFIX = 'sn:'
+
+
+def parse_usb_id(spec):
+    """'usb:0403:6010' -> (0x0403, 0x6010, None), 'usb:0403:6010:1' -> (0x0403, 0x6010, 1)"""
+    parts = spec[len(USB_PREFIX):].split(':')
+    interface = int(parts[2]) if len(parts) > 2 else None
+    return int(parts[0], 16), int(parts[1], 16), interface
+
+
+def is_device_match(spec):
+    """VID:PID 나 이름으로 찾아야 하는 지정인지."""
+    return isinstance(spec, str) and spec.startswith((USB_PREFIX, NAME_PREFIX, SERIAL_PREFIX))
+
+
+def _matches(spec, vid, pid, names, interface=None, serial_number=None):
+    if spec.startswith(USB_PREFIX):
+        want_vid, want_pid, want_interface = parse_usb_id(spec)
+        if want_interface is not None and interface != want_interface:
+            return False
+        return (vid, pid) == (want_vid, want_pid)
+    if spec.startswith(SERIAL_PREFIX):
+        return bool(serial_number) and serial_number.upper().startswith(spec[len(SERIAL_PREFIX):].upper())
+    needle = spec[len(NAME_PREFIX):].lower()
+    return any(needle in name.lower() for name in names if name)
+
+
+# ======================
+# 시리얼 포트
+# ======================
+def list_serial_ports():
+    """pyserial 의 ListPortInfo 목록 (device, vid, pid, description, manufacturer ...)."""
+    from serial.tools import list_ports
+    return list(list_ports.comports())
+
+
+def _usb_interface(port):
+    """ListPortInfo.location ('1-1.4:1.1', Windows 는 '1-4:x.1') 끝의 USB 인터페이스 번호."""
+    location = getattr(port, 'location', None) or ''
+    _, _, tail = location.rpartition(':')
+    _, _, number = tail.rpartition('.')
+    return int(number) if number.isdigit() else None
+
+
+def find_serial_port(specs):
+    """후보를 순서대로 보고 처음 찾은 포트 경로. 못 찾으면 None.
+
+    VID:PID / 이름 / 시리얼 번호 지정은 지금 꽂혀 있는 포트에서 찾는다. 그 외
+    문자열은 경로로 보고, 목록에 있거나 파일이 있으면 (pty 등 목록에 안 나오는
+    포트) 그대로 돌려주고 없으면 다음 후보로 넘어간다.
+    """
+    if isinstance(specs, str):
+        specs = [specs]
+    ports = list_serial_ports()
+    for spec in specs:
+        if not is_device_match(spec):
+            if any(port.device == spec for port in ports) or os.path.exists(spec):
+                return spec
+            continue
+        for port in ports:
+            if _matches(spec, port.vid, port.pid, (port.description, port.manufacturer, port.product),
+                        _usb_interface(port), port.serial_number):
+                return port.device
+    return None
+
+
+# ======================
+# 카메라
+# ======================
+def _sysfs_usb_id(device_dir):
+    """/sys/class/video4linux/videoN/device 에서 위로 올라가며 idVendor/idProduct."""
+    path = os.path.realpath(device_dir)
+    while path and path != '/':
+        vendor = os.path.join(path, 'idVendor')
+        if os.path.exists(vendor):
+            with open(vendor) as f:
+                vid = int(f.read().strip(), 16)
+            with open(os.path.join(path, 'idProduct')) as f:
+                pid = int(f.read().strip(), 16)
+            return vid, pid
+        path = os.path.dirname(path)
+    return None, None
+
+
+def list_cameras():
+    """[(번호, 이름, vid, pid)]. 번호는 cv2.VideoCapture 에 넘기는 값.
+
+    Linux 는 sysfs, Windows 는 pygrabber(있을 때, DirectShow 순서 = 번호)로
+    이름을 얻는다. Windows 에서는 VID/PID 를 알 수 없어 None 이다.
+    """
+    cameras = []
+    if sys.platform.startswith('linux'):
+        for node in sorted(glob.glob('/sys/class/video4linux/video*'),
+                           key=lambda p: int(p.rsplit('video', 1)[1])):
+            index = int(node.rsplit('video', 1)[1])
+            try:
+                with open(os.path.join(node, 'name')) as f:
+                    name = f.read().strip()
+            except OSError:
+                name = ''
+            vid, pid = _sysfs_usb_id(os.path.join(node, 'device'))
+            cameras.append((index, name, vid, pid))
+    elif sys.platform.startswith('win'):
+        try:
+            from pygrabber.dshow_graph import FilterGraph
+        except ImportError:
+            return cameras
+        for index, name in enumerate(FilterGraph().get_input_devices()):
+            cameras.append((index, name, None, None))
+    return cameras
+
+
+def find_camera(spec):
+    """VID:PID / 이름 지정에 맞는 카메라 번호. 못 찾으면 None."""
+    for index, name, vid, pid in list_cameras():
+        if _matches(spec, vid, pid, (name,)):
+            return index
+    return None
+
+
+def resolve_camera(spec):
+    """open_source 에 넘길 값. 장치 지정이면 번호로 바꾸고, 못 찾으면 None."""
+    if is_device_match(spec):
+        return find_camera(spec)
+    return spec
+
+
+def _usb_text(vid, pid):
+    return f"{vid:04x}:{pid:04x}" if vid is not None else '-'
+
+
+def main():
+    print("시리얼 포트")
+    try:
+        for port in list_serial_ports():
+            print(f"  {port.device:16} {_usb_text(port.vid, port.pid):10} if={_usb_interface(port)} "
+                  f"sn={port.serial_number or '-'}  {port.description}")
+    except ImportError:
+        print("  (pyserial 없음)")
+    print("카메라")
+    for index, name, vid, pid in list_cameras():
+        print(f"  {index:<16} {_usb_text(vid, pid):10} {name}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
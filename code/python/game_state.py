@@ -0,0 +1,182 @@
+"""볼/스트라이크/아웃/점수 규칙 (Qt 없이 동작하는 상태 기계).
+
+GUI 는 GameState.subscribe()로 도메인 이벤트를 받아 채팅/소리/효과만 처리한다.
+
+    game = GameState('mode1')
+    game.subscribe(lambda event, state: print(event, state.balls, state.strikes))
+    game.call('S')
+"""
+
+# --- 도메인 이벤트 ---
+BALL = 'ball'              # 볼 (카운트 증가)
+WALK = 'walk'              # 볼넷
+STRIKE = 'strike'          # 스트라이크 (카운트 증가)
+STRIKEOUT = 'strikeout'    # 삼진 (뒤이어 OUT 또는 INNING_END)
+OUT = 'out'                # 아웃 카운트 증가
+INNING_END = 'inning_end'  # 3아웃, 아웃 카운트 초기화
+TARGET_HIT = 'target_hit'  # 모드2 표적 적중
+RESET = 'reset'            # 카운트/점수 초기화
+
+EVENTS = (BALL, WALK, STRIKE, STRIKEOUT, OUT, INNING_END, TARGET_HIT, RESET)
+
+MODE_ABS = 'mode1'
+MODE_TARGET = 'mode2'
+TARGET_POINTS = 100
+
+
+class GameState:
+    """판정 문자('B', 'S', 'C')를 받아 카운트를 갱신하고 이벤트를 알린다."""
+    __slots__ = ('mode', 'balls', 'strikes', 'outs', 'score', 'innings', '_listeners')
+
+    def __init__(self, mode=MODE_ABS):
+        self.mode = mode
+        self.balls = 0
+        self.strikes = 0
+        self.outs = 0
+        self.score = 0
+        self.innings = 0
+        self._listeners = []
+
+    # ======================
+    # 구독
+    # ======================
+    def subscribe(self, listener):
+        """listener(event, state) 를 등록."""
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        self._listeners.remove(listener)
+
+    def _emit(self, event):
+        for listener in self._listeners:
+            listener(event, self)
+
+    @property
+    def is_target_mode(self):
+        return self.mode == MODE_TARGET
+
+    # ======================
+    # 규칙
+    # ======================
+    def call(self, char):
+        """UART 판정 문자 하나. 현재 모드에 맞지 않는 문자는 무시."""
+        if self.mode == MODE_TARGET:
+            if char == 'C':
+                self.target_hit()
+        elif char == 'B':
+            self.ball()
+        elif char == 'S':
+            self.strike()
+
+    def ball(self):
+        if self.balls < 3:
+            self.balls += 1
+            self._emit(BALL)
+        else:
+            self.balls = 0
+            self.strikes = 0
+            self._emit(WALK)
+
+    def strike(self):
+        if self.strikes < 2:
+            self.strikes += 1
+            self._emit(STRIKE)
+        else:
+            self._emit(STRIKEOUT)
+            self.out()
+            self.balls = 0
+            self.strikes = 0
+            self._emit(RESET)
+
+    def out(self):
+        if self.outs < 2:
+            self.outs += 1
+            self._emit(OUT)
+        else:
+            self.outs = 0
+            self.innings += 1
+            self._emit(INNING_END)
+
+    def target_hit(self):
+        self.score += TARGET_POINTS
+        self._emit(TARGET_HIT)
+
+    def reset_counts(self):
+        self.balls = 0
+        self.strikes = 0
+        self._emit(RESET)
+
+    def reset(self, mode=None):
+        """모드 전환 시 전체 초기화."""
+        if mode is not None:
+            self.mode = mode
+        self.balls = 0
+        self.strikes = 0
+        self.outs = 0
+        self.score = 0
+        self.innings = 0
+        self._emit(RESET)
+
+    # ======================
+    # 일괄 처리
+    # ======================
+    def apply(self, calls):
+        """판정 문자열(또는 bytes/반복 가능한 문자들)을 한 번에 적용.
+
+        구독자가 없으면 이벤트 객체 없이 지역 변수로만 계산하는 빠른 경로를
+        쓰고, 발생한 이벤트 수를 {이벤트: 횟수} 로 돌려준다.
+        """
+        if isinstance(calls, (bytes, bytearray)):
+            calls = calls.decode('ascii', 'ignore')
+        if self._listeners:
+            counts = dict.fromkeys(EVENTS, 0)
+
+            def count(event, state):
+                counts[event] += 1
+
+            self._listeners.append(count)
+            try:
+                for char in calls:
+                    self.call(char)
+            finally:
+                self._listeners.remove(count)
+            return counts
+
+        if self.mode == MODE_TARGET:
+            hits = calls.count('C') if isinstance(calls, str) else sum(1 for char in calls if char == 'C')
+            self.score += hits * TARGET_POINTS
+            counts = dict.fromkeys(EVENTS, 0)
+            counts[TARGET_HIT] = hits
+            return counts
+
+        balls, strikes, outs, innings = self.balls, self.strikes, self.outs, self.innings
+        n_ball = n_walk = n_strike = n_strikeout = n_out = n_inning = 0
+        for char in calls:
+            if char == 'B':
+                if balls < 3:
+                    balls += 1
+                    n_ball += 1
+                else:
+                    balls = strikes = 0
+                    n_walk += 1
+            elif char == 'S':
+                if strikes < 2:
+                    strikes += 1
+                    n_strike += 1
+                else:
+                    n_strikeout += 1
+                    balls = strikes = 0
+                    if outs < 2:
+                        outs += 1
+                        n_out += 1
+                    else:
+                        outs = 0
+                        innings += 1
+                        n_inning += 1
+        self.balls, self.strikes, self.outs, self.innings = balls, strikes, outs, innings
+        counts = dict.fromkeys(EVENTS, 0)
+        counts.update({
+            BALL: n_ball, WALK: n_walk, STRIKE: n_strike, STRIKEOUT: n_strikeout,
+            OUT: n_out, INNING_END: n_inning, RESET: n_strikeout,
+        })
+        return counts
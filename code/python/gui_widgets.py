@@ -0,0 +1,243 @@
+from collections import deque
+
+from PyQt5.QtCore import (
+    QAbstractListModel, QEasingCurve, QEvent, QModelIndex, QObject, QPoint, QPropertyAnimation, Qt, QTimer
+)
+from PyQt5.QtGui import QColor
+from PyQt5.QtWidgets import QAbstractItemView, QLabel, QListView
+
+from asset_cache import assets
+from tracing import tracer
+
+# ======================
+# B/S/O 카운트 점
+# ======================
+class CountDots:
+    """한 줄의 카운트 점(QLabel) 묶음.
+
+    켜짐/꺼짐 스타일시트를 한 번만 만들어 두고, 상태가 바뀐 점에만
+    setStyleSheet 를 호출한다. 카운트가 그대로면 아무 일도 하지 않으므로
+    update_bso_display 가 여러 번 불려도 다시 polish 되는 위젯이 없다.
+    """
+
+    def __init__(self, dots, color, glow=False):
+        self.dots = dots
+        radius = dots[0].width() // 2 if dots else 0
+        shadow = f" box-shadow: 0 0 5px {color};" if glow else ""
+        self.on_style = f"border-radius: {radius}px; background-color: {color}; border: 1px solid {color};{shadow}"
+        self.off_style = f"border-radius: {radius}px; background-color: transparent; border: 1px solid {color};"
+        self._lit = [None] * len(dots)
+
+    def show_count(self, count):
+        for i, dot in enumerate(self.dots):
+            lit = i < count
+            if self._lit[i] is not lit:
+                dot.setStyleSheet(self.on_style if lit else self.off_style)
+                self._lit[i] = lit
+
+
+# ======================
+# 판정 효과 (재사용 오버레이)
+# ======================
+# 효과 이름 -> (이미지, 너비, 높이)
+EFFECT_SPECS = {
+    'strike': ('font_strike.png', 570, 170),
+    'ball': ('font_ball.png', 470, 200),
+    'out': ('font_out.png', 550, 300),
+}
+# 대기열에서 더 중요한 효과가 덜 중요한 효과를 밀어냄
+EFFECT_PRIORITY = {'ball': 0, 'strike': 1, 'out': 2}
+CRACK_SPEC = ('crack_effect.png', 600, 400)
+EFFECT_DURATION_MS = 1000
+
+
+class EffectPlayer(QObject):
+    """판정 배너를 미리 만들어 둔 라벨/애니메이션으로 재생.
+
+    효과마다 QLabel 과 QPropertyAnimation 을 한 번만 만들고 재시작만 하므로
+    호출 비용이 일정하다. 배너가 재생 중일 때 들어온 요청은 대기 슬롯 하나에
+    모으며(coalesce), 재생 중이거나 대기 중인 것과 같은 효과는 버리고,
+    서로 다르면 우선순위가 높은 쪽만 남긴다 (예: 볼넷 배너가 대기 중이면
+    뒤따르는 BALL 배너는 생략).
+    """
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.parent_widget = parent
+        self.labels = {}
+        self.animations = {}
+        for kind, (image, width, height) in EFFECT_SPECS.items():
+            label = QLabel(parent)
+            label.setPixmap(assets.scaled(image, width, height))
+            label.setFixedSize(width, height)
+            label.hide()
+            label.installEventFilter(self)
+            anim = QPropertyAnimation(label, b"pos", self)
+            anim.setDuration(EFFECT_DURATION_MS)
+            anim.setEasingCurve(QEasingCurve.InOutCubic)
+            anim.finished.connect(self._finished)
+            self.labels[kind] = label
+            self.animations[kind] = anim
+
+        image, width, height = CRACK_SPEC
+        self.crack_label = QLabel(parent)
+        self.crack_label.setPixmap(assets.scaled(image, width, height))
+        self.crack_label.setFixedSize(width, height)
+        self.crack_label.hide()
+        self._crack_show = QTimer(self)
+        self._crack_show.setSingleShot(True)
+        self._crack_show.timeout.connect(self._show_crack)
+        self._crack_hide = QTimer(self)
+        self._crack_hide.setSingleShot(True)
+        self._crack_hide.timeout.connect(self.crack_label.hide)
+
+        self.current = None
+        self.pending = None
+        self.shown = 0
+        self.coalesced = 0
+        self._await_paint = None
+
+    def show(self, kind):
+        if self.current is None:
+            self._start(kind)
+            return
+        if kind in (self.current, self.pending):
+            self.coalesced += 1
+            return
+        if self.pending is not None:
+            self.coalesced += 1
+            if EFFECT_PRIORITY[kind] < EFFECT_PRIORITY[self.pending]:
+                return
+        self.pending = kind
+
+    def stop(self):
+        self.pending = None
+        if self.current is not None:
+            self.animations[self.current].stop()
+            self.labels[self.current].hide()
+            self.current = None
+        self._crack_show.stop()
+        self._crack_hide.stop()
+        self.crack_label.hide()
+
+    def _start(self, kind):
+        self.current = kind
+        self.shown += 1
+        label = self.labels[kind]
+        parent = self.parent_widget
+        start_x = -label.width()
+        start_y = (parent.height() - label.height()) // 4 - 100
+        mid_x = (parent.width() - label.width()) // 2
+        end_x = parent.width()
+
+        label.move(start_x, start_y)
+        label.show()
+        label.raise_()
+        if tracer.enabled:
+            tracer.stage('effect')
+            self._await_paint = label
+
+        anim = self.animations[kind]
+        anim.setKeyValueAt(0.0, QPoint(start_x, start_y))
+        anim.setKeyValueAt(0.1, QPoint(mid_x, start_y))
+        anim.setKeyValueAt(0.9, QPoint(mid_x, start_y))
+        anim.setKeyValueAt(1.0, QPoint(end_x, start_y))
+        anim.start()
+
+        if kind == 'out':
+            # --- 크랙 효과 ---
+            self.crack_label.move(mid_x - 50, start_y - 40)
+            self._crack_show.start(250)
+            self._crack_hide.start(750)
+
+    def eventFilter(self, obj, event):
+        # 추적 중이면 배너가 처음 그려지는 시각을 기록 (판정 -> 화면 지연)
+        if obj is self._await_paint and event.type() == QEvent.Paint:
+            self._await_paint = None
+            tracer.stage('paint')
+        return False
+
+    def _show_crack(self):
+        self.crack_label.show()
+        self.crack_label.raise_()
+        if self.current is not None:
+            self.labels[self.current].raise_()
+
+    def _finished(self):
+        if self.current is not None:
+            self.labels[self.current].hide()
+        self.current = None
+        kind, self.pending = self.pending, None
+        if kind is not None:
+            self._start(kind)
+
+
+# ======================
+# 경기 중계 로그 (고정 크기 링)
+# ======================
+class CommentaryModel(QAbstractListModel):
+    """최근 capacity 줄만 보관하는 리스트 모델.
+
+    가득 차면 가장 오래된 줄을 지우고 새 줄을 넣으므로 append 비용은
+    세션 길이와 관계없이 일정하다. spill_path 를 주면 밀려난 줄을 파일에
+    덧붙여 전체 기록을 남긴다.
+    """
+
+    def __init__(self, capacity=200, color=None, spill_path=None, parent=None):
+        super().__init__(parent)
+        self.capacity = capacity
+        self._lines = deque()
+        self._color = QColor(color) if color else None
+        self._spill = open(spill_path, 'a', encoding='utf-8', buffering=1) if spill_path else None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._lines)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._lines[index.row()]
+        if role == Qt.ForegroundRole and self._color is not None:
+            return self._color
+        return None
+
+    def append(self, line):
+        if len(self._lines) >= self.capacity:
+            self.beginRemoveRows(QModelIndex(), 0, 0)
+            old = self._lines.popleft()
+            self.endRemoveRows()
+            if self._spill:
+                self._spill.write(old + '\n')
+        row = len(self._lines)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._lines.append(line)
+        self.endInsertRows()
+
+    def close(self):
+        if self._spill:
+            for line in self._lines:
+                self._spill.write(line + '\n')
+            self._spill.close()
+            self._spill = None
+
+
+class CommentaryLog(QListView):
+    """QTextBrowser 대신 쓰는 중계 로그 뷰. append(message)로 한 줄 추가."""
+
+    def __init__(self, capacity=200, color=None, spill_path=None, parent=None):
+        super().__init__(parent)
+        self.log_model = CommentaryModel(capacity, color, spill_path, self)
+        self.setModel(self.log_model)
+        self.setWordWrap(True)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+
+    def append(self, message):
+        self.log_model.append(message)
+        self.scrollToBottom()
+
+    def close_log(self):
+        self.log_model.close()
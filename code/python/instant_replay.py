@@ -0,0 +1,207 @@
+"""판정 클립 즉석 리플레이 (슬로 모션 / 프레임 단위 이동).
+
+ClipRecorder 가 저장한 .absclip 을 읽어, 백그라운드 디코딩 스레드가 현재
+위치부터 cache_size 장을 미리 JPEG -> RGB FrameSlot 으로 풀어 둔다. GUI 는
+프레임 타이머마다 frame()으로 보여줄 슬롯만 받아 VideoSurface 에 넘기므로
+실시간 캡처와 UART 처리는 그대로 돌아간다.
+"""
+import bisect
+import threading
+import time
+
+import cv2
+
+from clip_recorder import load_clip
+from video_pipeline import FrameConverter
+
+REPLAY_CACHE_FRAMES = 8     # 미리 디코딩해 둘 프레임 수
+REPLAY_SPEED = 0.25         # 기본 슬로 모션 배속
+REPLAY_HOLD_SECONDS = 1.0   # 마지막 프레임에서 멈춰 있는 시간
+MIN_SPEED, MAX_SPEED = 0.0625, 1.0
+
+
+class ReplayPlayer:
+    """load() -> frame() 반복. frame()은 GUI 스레드에서만 호출."""
+
+    def __init__(self, cache_size=REPLAY_CACHE_FRAMES, speed=REPLAY_SPEED):
+        self.cache_size = cache_size
+        self.speed = speed
+        # 캐시 + VideoSurface 가 잡고 있는 슬롯까지 여유를 둔 링
+        self.converter = FrameConverter(ring_size=cache_size + 3)
+        self.path = None
+        self.kind = None
+        self.index = 0
+        self.playing = False
+        self.finished = True
+        self.misses = 0          # 디코딩이 못 따라와 이전 프레임을 유지한 횟수
+        self._frames = []        # [(판정 기준 시각, JPEG)]
+        self._offsets = []
+        self._cache = {}         # index -> FrameSlot (디코딩 실패는 None)
+        self._generation = 0
+        self._position = 0.0
+        self._last_tick = None
+        self._hold_until = None
+        self._shown = -1
+        self._missed = -1
+        self._running = True
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._decode_loop, name='replay-decoder', daemon=True)
+        self._thread.start()
+
+    # ======================
+    # 재생 제어 (GUI 스레드)
+    # ======================
+    def load(self, path):
+        """클립을 읽고 처음부터 재생. 프레임이 없으면 False."""
+        kind, _, frames = load_clip(path)
+        with self._cond:
+            self._drop_cache()
+            self._generation += 1
+            self._frames = frames
+            self._offsets = [offset for offset, _ in frames]
+            self.index = 0
+            self._cond.notify_all()
+        self.path = path
+        self.kind = kind
+        self._restart()
+        self.playing = bool(frames)
+        self.finished = not frames
+        return bool(frames)
+
+    def toggle(self):
+        """일시정지 / 재생. 끝난 뒤에는 처음부터 다시."""
+        if self.playing:
+            self.playing = False
+            return
+        if self._frames and self.index >= len(self._frames) - 1:
+            self._restart()
+            self._seek(0)
+        self.playing = bool(self._frames)
+        self._last_tick = None
+        self._hold_until = None
+        self.finished = False
+
+    def step(self, delta):
+        """일시정지 후 delta 프레임 이동."""
+        if not self._frames:
+            return
+        self.playing = False
+        self._hold_until = None
+        self.finished = False
+        index = min(max(self.index + delta, 0), len(self._frames) - 1)
+        self._position = self._offsets[index]
+        self._seek(index)
+
+    def set_speed(self, speed):
+        self.speed = min(max(speed, MIN_SPEED), MAX_SPEED)
+
+    def stop(self):
+        self.playing = False
+        self.finished = True
+        with self._cond:
+            self._drop_cache()
+            self._frames = []
+            self._offsets = []
+            self._generation += 1
+
+    def frame(self, now=None):
+        """새로 보여줄 슬롯(retain 됨). 바뀐 게 없거나 아직 디코딩 전이면 None."""
+        if not self._frames:
+            return None
+        now = time.monotonic() if now is None else now
+        if self.playing:
+            if self._last_tick is not None:
+                self._position += (now - self._last_tick) * self.speed
+            self._last_tick = now
+            last = len(self._frames) - 1
+            index = min(bisect.bisect_right(self._offsets, self._position) - 1, last)
+            if index != self.index:
+                self._seek(max(index, 0))
+            if index >= last:
+                self.playing = False
+                self._hold_until = now + REPLAY_HOLD_SECONDS
+        elif self._hold_until is not None and now >= self._hold_until:
+            self._hold_until = None
+            self.finished = True
+
+        with self._cond:
+            if self.index == self._shown:
+                return None
+            slot = self._cache.get(self.index)
+            if slot is None:
+                if self.index not in self._cache and self._missed != self.index:
+                    self._missed = self.index
+                    self.misses += 1
+                return None
+            self._shown = self.index
+            return slot.retain()
+
+    def close(self):
+        with self._cond:
+            self._running = False
+            self._drop_cache()
+            self._cond.notify_all()
+        self._thread.join(timeout=1)
+
+    def stats(self):
+        return {'frames': len(self._frames), 'index': self.index,
+                'cached': len(self._cache), 'misses': self.misses}
+
+    def _restart(self):
+        self._position = self._offsets[0] if self._offsets else 0.0
+        self._last_tick = None
+        self._hold_until = None
+        self._shown = -1
+        self._missed = -1
+
+    def _seek(self, index):
+        with self._cond:
+            self.index = index
+            # 새 창 밖의 프레임은 링에 돌려준다
+            end = index + self.cache_size
+            for key in [key for key in self._cache if key < index or key >= end]:
+                slot = self._cache.pop(key)
+                if slot is not None:
+                    slot.release()
+            self._cond.notify_all()
+
+    def _drop_cache(self):
+        for slot in self._cache.values():
+            if slot is not None:
+                slot.release()
+        self._cache.clear()
+
+    # ======================
+    # 디코딩 스레드
+    # ======================
+    def _next_missing(self):
+        end = min(self.index + self.cache_size, len(self._frames))
+        for index in range(self.index, end):
+            if index not in self._cache:
+                return index
+        return None
+
+    def _decode_loop(self):
+        while True:
+            with self._cond:
+                while self._running and self._next_missing() is None:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                index = self._next_missing()
+                generation = self._generation
+                data = self._frames[index][1]
+            bgr = cv2.imdecode(data, cv2.IMREAD_COLOR)
+            slot = self.converter.convert(bgr) if bgr is not None else None
+            with self._cond:
+                stale = (generation != self._generation or index in self._cache
+                         or not self.index <= index < self.index + self.cache_size)
+                if stale:
+                    if slot is not None:
+                        slot.release()
+                    continue
+                if slot is None and bgr is not None:
+                    # 링이 잠시 가득 참: 화면이 슬롯을 놓을 때까지 잠깐 대기 후 재시도
+                    self._cond.wait(0.005)
+                    continue
+                self._cache[index] = slot
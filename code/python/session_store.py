@@ -0,0 +1,282 @@
+"""경기 세션 이벤트 저장소 (SQLite, 묶음 커밋).
+
+UART 이벤트, 판정, 카운트 변화, 점수 변화를 한 DB 파일에 모든 세션을 함께
+쌓는다. GUI 스레드의 log()는 큐에 넣기만 하고, 쓰기 스레드가 batch_size 개
+또는 flush_interval 초마다 한 트랜잭션으로 커밋한다. 조회는 (세션, 시각),
+(종류, 세션), (세션, 이닝), 세션을 가로지르는 기간 조회는 (시각), (종류, 시각)
+인덱스를 타므로 세션이 수천 개여도 필요한 줄만 읽는다.
+
+    python session_store.py list sessions.db
+    python session_store.py stats sessions.db              # 전체 세션 합계
+    python session_store.py stats sessions.db --session 12
+    python session_store.py events sessions.db --session 12 --type strike --inning 2
+    python session_store.py events sessions.db --type strikeout --since 2025-03-01 --until "2025-03-08 18:00"
+    python session_store.py stats sessions.db --since 2025-03-01
+"""
+import argparse
+import json
+import queue
+import sqlite3
+import sys
+import threading
+import time
+
+# --- game_state 이벤트 외에 기록하는 종류 ---
+UART = 'uart'      # 수신한 UART 이벤트 (seq/tick/통과 위치)
+CALL = 'call'      # GameState 에 적용한 판정 문자 (data.source: fpga / soft / key)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id      INTEGER PRIMARY KEY,
+    started REAL NOT NULL,
+    ended   REAL,
+    mode    TEXT
+);
+CREATE TABLE IF NOT EXISTS events (
+    session_id INTEGER NOT NULL,
+    t          REAL NOT NULL,
+    inning     INTEGER NOT NULL,
+    type       TEXT NOT NULL,
+    kind       TEXT,
+    balls      INTEGER,
+    strikes    INTEGER,
+    outs       INTEGER,
+    score      INTEGER,
+    data       TEXT
+);
+CREATE INDEX IF NOT EXISTS events_session_time ON events (session_id, t);
+CREATE INDEX IF NOT EXISTS events_type_session ON events (type, session_id);
+CREATE INDEX IF NOT EXISTS events_session_inning ON events (session_id, inning);
+CREATE INDEX IF NOT EXISTS events_time ON events (t);
+CREATE INDEX IF NOT EXISTS events_type_time ON events (type, t);
+"""
+
+_INSERT = ("INSERT INTO events (session_id, t, inning, type, kind, balls, strikes, outs, score, data) "
+           "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)")
+
+
+def connect(path):
+    conn = sqlite3.connect(path)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    return conn
+
+
+class SessionStore:
+    """log()는 어느 스레드에서 불러도 되고 DB 를 기다리지 않는다."""
+
+    def __init__(self, path='sessions.db', batch_size=64, flush_interval=1.0):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.session_id = None
+        self.written = 0
+        self.commits = 0
+        conn = connect(path)
+        with conn:
+            conn.executescript(SCHEMA)
+        conn.close()
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name='session-writer', daemon=True)
+        self._writer.start()
+
+    # ======================
+    # 기록
+    # ======================
+    def begin(self, mode=None):
+        """새 세션 시작 (이전 세션은 종료 처리). 세션 id 반환."""
+        self.end()
+        conn = connect(self.path)
+        with conn:
+            cur = conn.execute('INSERT INTO sessions (started, mode) VALUES (?, ?)', (time.time(), mode))
+        conn.close()
+        self.session_id = cur.lastrowid
+        return self.session_id
+
+    def end(self):
+        if self.session_id is not None:
+            self._queue.put(('end', self.session_id, time.time()))
+            self.session_id = None
+
+    def log(self, event_type, state=None, kind=None, **data):
+        """이벤트 한 줄. state 가 있으면 그 시점의 카운트/점수/이닝을 함께 기록."""
+        if self.session_id is None:
+            return
+        if state is not None:
+            row = (self.session_id, time.time(), state.innings, event_type, kind,
+                   state.balls, state.strikes, state.outs, state.score,
+                   json.dumps(data, separators=(',', ':')) if data else None)
+        else:
+            row = (self.session_id, time.time(), 0, event_type, kind, None, None, None, None,
+                   json.dumps(data, separators=(',', ':')) if data else None)
+        self._queue.put(row)
+
+    def close(self):
+        self.end()
+        self._queue.put(None)
+        self._writer.join()
+
+    def stats(self):
+        return {'written': self.written, 'commits': self.commits, 'queued': self._queue.qsize()}
+
+    # ======================
+    # 쓰기 스레드
+    # ======================
+    def _write_loop(self):
+        conn = connect(self.path)
+        batch = []
+        deadline = None
+        running = True
+        while running:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = ()
+            if item is None:
+                running = False
+            elif item and item[0] == 'end':
+                self._commit(conn, batch)
+                batch = []
+                with conn:
+                    conn.execute('UPDATE sessions SET ended = ? WHERE id = ?', (item[2], item[1]))
+                deadline = None
+                continue
+            elif item:
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+            if batch and (not running or len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                self._commit(conn, batch)
+                batch = []
+                deadline = None
+        conn.close()
+
+    def _commit(self, conn, batch):
+        if not batch:
+            return
+        with conn:
+            conn.executemany(_INSERT, batch)
+        self.written += len(batch)
+        self.commits += 1
+
+
+# ======================
+# 조회
+# ======================
+def list_sessions(conn, limit=50):
+    return conn.execute(
+        'SELECT s.id, s.started, s.ended, s.mode, '
+        '(SELECT COUNT(*) FROM events e WHERE e.session_id = s.id) '
+        'FROM sessions s ORDER BY s.id DESC LIMIT ?', (limit,)).fetchall()
+
+
+def query_events(conn, session_id=None, types=None, inning=None, since=None, until=None):
+    """조건에 맞는 이벤트 행을 시각 순으로 하나씩 생성 (전체를 메모리에 올리지 않음)."""
+    where, args = [], []
+    if session_id is not None:
+        where.append('session_id = ?')
+        args.append(session_id)
+    if types:
+        where.append(f"type IN ({','.join('?' * len(types))})")
+        args.extend(types)
+    if inning is not None:
+        where.append('inning = ?')
+        args.append(inning)
+    if since is not None:
+        where.append('t >= ?')
+        args.append(since)
+    if until is not None:
+        where.append('t < ?')
+        args.append(until)
+    sql = 'SELECT session_id, t, inning, type, kind, balls, strikes, outs, score, data FROM events'
+    if where:
+        sql += ' WHERE ' + ' AND '.join(where)
+    sql += ' ORDER BY session_id, t'
+    yield from conn.execute(sql, args)
+
+
+def event_counts(conn, session_id=None, since=None, until=None):
+    """{종류: 횟수}. session_id 가 없으면 모든 세션 합계, since/until 은 기간 (epoch 초)."""
+    where, args = [], []
+    if session_id is not None:
+        where.append('session_id = ?')
+        args.append(session_id)
+    if since is not None:
+        where.append('t >= ?')
+        args.append(since)
+    if until is not None:
+        where.append('t < ?')
+        args.append(until)
+    sql = 'SELECT type, COUNT(*) FROM events'
+    if where:
+        sql += ' WHERE ' + ' AND '.join(where)
+    return dict(conn.execute(sql + ' GROUP BY type', args).fetchall())
+
+
+def session_summary(conn, session_id):
+    """세션 하나의 마지막 상태와 이닝 수."""
+    return conn.execute(
+        'SELECT MAX(inning), MAX(score), MIN(t), MAX(t) FROM events WHERE session_id = ?',
+        (session_id,)).fetchone()
+
+
+def parse_time(text):
+    """'2025-03-01', '2025-03-01 18:00', '2025-03-01 18:00:30' 또는 epoch 초 -> epoch 초 (현지 시각)."""
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    for fmt in ('%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M', '%Y-%m-%d'):
+        try:
+            return time.mktime(time.strptime(text, fmt))
+        except ValueError:
+            continue
+    raise argparse.ArgumentTypeError(f"시각 형식이 아닙니다: {text!r} (예: 2025-03-01 18:00)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='경기 세션 이벤트 조회')
+    sub = parser.add_subparsers(dest='command', required=True)
+    p = sub.add_parser('list')
+    p.add_argument('db')
+    p.add_argument('--limit', type=int, default=50)
+    p = sub.add_parser('stats')
+    p.add_argument('db')
+    p.add_argument('--session', type=int)
+    p.add_argument('--since', type=parse_time, help='이 시각 이후 (포함)')
+    p.add_argument('--until', type=parse_time, help='이 시각 이전 (미포함)')
+    p = sub.add_parser('events')
+    p.add_argument('db')
+    p.add_argument('--session', type=int)
+    p.add_argument('--type', action='append')
+    p.add_argument('--inning', type=int)
+    p.add_argument('--since', type=parse_time, help='이 시각 이후 (포함)')
+    p.add_argument('--until', type=parse_time, help='이 시각 이전 (미포함)')
+    args = parser.parse_args(argv)
+
+    conn = sqlite3.connect(args.db)
+    if args.command == 'list':
+        for sid, started, ended, mode, count in list_sessions(conn, args.limit):
+            span = f"{ended - started:7.0f}s" if ended else '  진행중'
+            print(f"{sid:6d}  {time.strftime('%Y-%m-%d %H:%M', time.localtime(started))}  "
+                  f"{mode or '-':6}  {span}  {count} events")
+    elif args.command == 'stats':
+        for name, count in sorted(event_counts(conn, args.session, args.since, args.until).items()):
+            print(f"{name:12} {count}")
+        if args.session is not None:
+            innings, score, t0, t1 = session_summary(conn, args.session)
+            if t0 is not None:
+                print(f"이닝 {innings}  점수 {score}  {t1 - t0:.0f}s")
+    else:
+        for sid, t, inning, event_type, kind, balls, strikes, outs, score, data in query_events(
+                conn, args.session, args.type, args.inning, args.since, args.until):
+            extra = f"  {json.loads(data)}" if data else ''
+            print(f"{sid:6d}  {time.strftime('%H:%M:%S', time.localtime(t))}  {inning}회  "
+                  f"{event_type:10} {kind or '':2} B{balls} S{strikes} O{outs} {score}{extra}")
+    conn.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
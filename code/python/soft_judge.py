@@ -0,0 +1,421 @@
+"""호스트 쪽 소프트웨어 ABS 판정 (FPGA 링크가 끊겼을 때의 대체 + 교차 검증).
+
+VideoThread 가 받은 BGR 프레임을 320x240 으로 줄여 공유 메모리 링에 넣으면,
+별도 프로세스의 BallTracker 가 초록 공을 분할 -> 프레임 간 중심 추적 ->
+스트라이크 존 교차 여부로 'S' / 'B' 를 판정한다. GUI 는 poll()로 결과만
+가져가므로 판정이 느려져도 화면이 막히지 않는다 (밀린 프레임은 버림).
+
+    python soft_judge.py --frames 1200            # 합성 영상으로 처리 속도 측정
+    python soft_judge.py --source clip.mp4 --process          # 60 FPS 로 작업 프로세스에 넘김
+"""
+import argparse
+import math
+import multiprocessing as mp
+import queue
+import sys
+import time
+from multiprocessing import shared_memory
+
+import cv2
+import numpy as np
+
+JUDGE_WIDTH, JUDGE_HEIGHT = 320, 240     # FPGA 프레임 버퍼와 같은 크기
+JUDGE_SLOTS = 4                          # 공유 메모리 프레임 수
+READY_TIMEOUT = 10.0                     # 작업 프로세스 시작 대기 (spawn + cv2 import)
+
+# OpenCV HSV (H 0~180): ChromaKey_Detector 가 잡는 초록 공
+GREEN_HSV_LOW = np.array([35, 80, 60], dtype=np.uint8)
+GREEN_HSV_HIGH = np.array([85, 255, 255], dtype=np.uint8)
+
+# 정규화 좌표 (x0, y0, x1, y1). SyntheticSource 의 스트라이크 존 가이드와 같음
+STRIKE_ZONE = (0.4, 1 / 3, 0.6, 2 / 3)
+MIN_BALL_AREA = 12          # 픽셀 (320x240 기준)
+LOST_FRAMES = 3             # 이만큼 연속으로 안 보이면 투구 종료
+MIN_TRACK_POINTS = 4        # 이보다 짧은 궤적은 잡음으로 버림
+MAX_JUMP = 0.25             # 예측 위치에서 화면 폭의 25% 이상 벗어나면 새 투구
+
+
+class SoftCall:
+    """소프트웨어 판정 하나 (프로세스 간 pickle 로 전달)."""
+    __slots__ = ('kind', 'timestamp', 't_start', 'points', 'cross_x', 'cross_y')
+
+    def __init__(self, kind, timestamp, t_start, points, cross_x=None, cross_y=None):
+        self.kind = kind
+        self.timestamp = timestamp      # 마지막으로 공이 보인 프레임 시각 (monotonic)
+        self.t_start = t_start
+        self.points = points
+        self.cross_x = cross_x          # 존을 지난 위치 (정규화), 볼이면 None
+        self.cross_y = cross_y
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+    def __repr__(self):
+        return f"SoftCall({self.kind!r}, points={self.points}, t={self.timestamp:.3f})"
+
+
+def segment_hits_rect(x0, y0, x1, y1, rect):
+    """선분 (x0,y0)-(x1,y1) 이 rect 와 만나면 첫 교차점, 아니면 None (Liang-Barsky)."""
+    left, top, right, bottom = rect
+    dx, dy = x1 - x0, y1 - y0
+    t_in, t_out = 0.0, 1.0
+    for p, q in ((-dx, x0 - left), (dx, right - x0), (-dy, y0 - top), (dy, bottom - y0)):
+        if p == 0:
+            if q < 0:
+                return None
+        else:
+            t = q / p
+            if p < 0:
+                t_in = max(t_in, t)
+            else:
+                t_out = min(t_out, t)
+            if t_in > t_out:
+                return None
+    return x0 + t_in * dx, y0 + t_in * dy
+
+
+# ======================
+# 분할 + 추적 + 판정
+# ======================
+class BallTracker:
+    """프레임마다 update(bgr, timestamp)를 부르면 투구가 끝날 때 SoftCall 반환."""
+
+    def __init__(self, width=JUDGE_WIDTH, height=JUDGE_HEIGHT, zone=STRIKE_ZONE,
+                 min_area=MIN_BALL_AREA, lost_frames=LOST_FRAMES,
+                 min_points=MIN_TRACK_POINTS, max_jump=MAX_JUMP):
+        self.width = width
+        self.height = height
+        self.zone = zone
+        self.min_area = min_area
+        self.lost_frames = lost_frames
+        self.min_points = min_points
+        self.max_jump = max_jump
+        self.track = []          # [(timestamp, x, y, r)] 정규화 좌표
+        self.missing = 0
+        self.frames = 0
+        self._hsv = np.empty((height, width, 3), dtype=np.uint8)
+        self._mask = np.empty((height, width), dtype=np.uint8)
+
+    def segment(self, bgr):
+        """가장 큰 초록 덩어리의 (x, y, 반지름) 정규화 좌표, 없으면 None."""
+        cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV, dst=self._hsv)
+        cv2.inRange(self._hsv, GREEN_HSV_LOW, GREEN_HSV_HIGH, dst=self._mask)
+        count, _, stats, centroids = cv2.connectedComponentsWithStats(self._mask, connectivity=8)
+        if count <= 1:
+            return None
+        areas = stats[1:, cv2.CC_STAT_AREA]
+        best = int(np.argmax(areas))
+        area = int(areas[best])
+        if area < self.min_area:
+            return None
+        cx, cy = centroids[best + 1]
+        return cx / self.width, cy / self.height, math.sqrt(area / math.pi) / self.width
+
+    def update(self, bgr, timestamp):
+        self.frames += 1
+        ball = self.segment(bgr)
+        if ball is None:
+            self.missing += 1
+            if self.track and self.missing >= self.lost_frames:
+                return self._finish()
+            return None
+
+        self.missing = 0
+        call = None
+        if self.track:
+            # 등속 예측에서 너무 멀면 다른 투구로 보고 앞 궤적을 마감
+            _, px, py, _ = self.track[-1]
+            if len(self.track) > 1:
+                _, qx, qy, _ = self.track[-2]
+                px, py = 2 * px - qx, 2 * py - qy
+            if math.hypot(ball[0] - px, ball[1] - py) > self.max_jump:
+                call = self._finish()
+        self.track.append((timestamp, ball[0], ball[1], ball[2]))
+        return call
+
+    def _finish(self):
+        track, self.track = self.track, []
+        if len(track) < self.min_points:
+            return None
+        # 공이 존에 걸치기만 해도 스트라이크: 반지름만큼 존을 넓혀서 검사
+        radius = max(point[3] for point in track)
+        left, top, right, bottom = self.zone
+        zone = (left - radius, top - radius * self.width / self.height,
+                right + radius, bottom + radius * self.width / self.height)
+        hit = None
+        for (_, x0, y0, _), (_, x1, y1, _) in zip(track, track[1:]):
+            hit = segment_hits_rect(x0, y0, x1, y1, zone)
+            if hit is not None:
+                break
+        if hit is None:
+            return SoftCall('B', track[-1][0], track[0][0], len(track))
+        return SoftCall('S', track[-1][0], track[0][0], len(track), hit[0], hit[1])
+
+
+# ======================
+# 작업 프로세스
+# ======================
+def _judge_worker(shm_name, slots, notices, results, consumed, ready, options):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    frames = np.ndarray((slots, JUDGE_HEIGHT, JUDGE_WIDTH, 3), dtype=np.uint8, buffer=shm.buf)
+    tracker = BallTracker(**options)
+    ready.set()
+    try:
+        while True:
+            item = notices.get()
+            if item is None:
+                break
+            index, seq, timestamp = item
+            call = tracker.update(frames[index], timestamp)
+            consumed.value = seq
+            if call is not None:
+                results.put(call)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        del frames
+        shm.close()
+
+
+class SoftJudge:
+    """BallTracker 를 별도 프로세스에서 실행. submit()은 캡처 스레드, poll()은 GUI 스레드."""
+
+    def __init__(self, slots=JUDGE_SLOTS, **options):
+        self.slots = slots
+        self.options = options
+        self.submitted = 0
+        self.dropped = 0
+        self._shm = None
+        self._frames = None
+        self._process = None
+        self._notices = None
+        self._results = None
+        self._consumed = None
+        self._ready = None
+
+    @property
+    def ready(self):
+        """작업 프로세스가 프레임을 받을 준비가 됐는지 (그 전 submit 은 버림)."""
+        return self._ready is not None and self._ready.is_set()
+
+    def wait_ready(self, timeout=READY_TIMEOUT):
+        return self._ready is not None and self._ready.wait(timeout)
+
+    def start(self):
+        ctx = mp.get_context('spawn')
+        size = self.slots * JUDGE_HEIGHT * JUDGE_WIDTH * 3
+        self._shm = shared_memory.SharedMemory(create=True, size=size)
+        self._frames = np.ndarray((self.slots, JUDGE_HEIGHT, JUDGE_WIDTH, 3),
+                                  dtype=np.uint8, buffer=self._shm.buf)
+        self._notices = ctx.Queue()
+        self._results = ctx.Queue()
+        self._consumed = ctx.Value('q', 0, lock=False)
+        self._ready = ctx.Event()
+        self._process = ctx.Process(
+            target=_judge_worker, name='soft-judge', daemon=True,
+            args=(self._shm.name, self.slots, self._notices, self._results,
+                  self._consumed, self._ready, self.options))
+        self._process.start()
+
+    def submit(self, bgr, timestamp=None):
+        """프레임 한 장을 넘긴다. 작업 프로세스가 준비 전이거나 밀려 있으면 버리고 False."""
+        if self._process is None:
+            return False
+        if not self._ready.is_set() or self.submitted - self._consumed.value >= self.slots:
+            self.dropped += 1
+            return False
+        index = self.submitted % self.slots
+        target = self._frames[index]
+        if bgr.shape == target.shape:
+            np.copyto(target, bgr)
+        else:
+            cv2.resize(bgr, (JUDGE_WIDTH, JUDGE_HEIGHT), dst=target, interpolation=cv2.INTER_NEAREST)
+        self.submitted += 1
+        if timestamp is None:
+            timestamp = time.monotonic()
+        self._notices.put((index, self.submitted, timestamp))
+        return True
+
+    def poll(self):
+        """쌓인 SoftCall 목록 (블록하지 않음)."""
+        calls = []
+        if self._results is None:
+            return calls
+        while True:
+            try:
+                calls.append(self._results.get_nowait())
+            except queue.Empty:
+                return calls
+
+    def stats(self):
+        processed = self._consumed.value if self._consumed is not None else 0
+        return {'submitted': self.submitted, 'processed': processed, 'dropped': self.dropped}
+
+    def drain(self, timeout=2.0):
+        """넘긴 프레임을 작업 프로세스가 다 처리할 때까지 대기. 다 처리했으면 True."""
+        deadline = time.monotonic() + timeout
+        while self._consumed is not None and self._consumed.value < self.submitted:
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+    def stop(self):
+        if self._process is None:
+            return
+        self._notices.put(None)
+        self._process.join(timeout=2)
+        if self._process.is_alive():
+            self._process.terminate()
+        self._process = None
+        self._frames = None
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+
+
+# ======================
+# FPGA 판정과 교차 검증
+# ======================
+class JudgeCrossCheck:
+    """FPGA 와 소프트웨어 판정을 시각으로 짝지어 불일치를 기록.
+
+    window 초 안에 짝이 없으면 한쪽만 판정한 것으로 본다. 시각은 모두
+    time.monotonic() 기준.
+    """
+
+    def __init__(self, window=1.0, log_path=None):
+        self.window = window
+        self.log_path = log_path
+        self.agree = 0
+        self.disagree = 0
+        self.fpga_only = 0
+        self.soft_only = 0
+        self._fpga = []      # [(timestamp, kind)]
+        self._soft = []      # [SoftCall]
+
+    def fpga(self, kind, timestamp):
+        if kind not in ('S', 'B'):
+            return
+        for i, call in enumerate(self._soft):
+            if abs(call.timestamp - timestamp) <= self.window:
+                del self._soft[i]
+                self._compare(kind, call)
+                return
+        self._fpga.append((timestamp, kind))
+
+    def soft(self, call):
+        for i, (timestamp, kind) in enumerate(self._fpga):
+            if abs(call.timestamp - timestamp) <= self.window:
+                del self._fpga[i]
+                self._compare(kind, call)
+                return
+        self._soft.append(call)
+
+    def expire(self, now):
+        """window 가 지나도 짝이 없는 판정을 한쪽 판정으로 기록."""
+        while self._fpga and now - self._fpga[0][0] > self.window:
+            _, kind = self._fpga.pop(0)
+            self.fpga_only += 1
+            self._log(f"FPGA 만 판정: {kind}")
+        while self._soft and now - self._soft[0].timestamp > self.window:
+            call = self._soft.pop(0)
+            self.soft_only += 1
+            self._log(f"소프트웨어만 판정: {call.kind} (궤적 {call.points}점)")
+
+    def _compare(self, kind, call):
+        if kind == call.kind:
+            self.agree += 1
+        else:
+            self.disagree += 1
+            self._log(f"판정 불일치: FPGA {kind} / 소프트웨어 {call.kind} (궤적 {call.points}점)")
+
+    def _log(self, message):
+        line = f"[{time.strftime('%H:%M:%S')}] {message}"
+        print(line)
+        if self.log_path:
+            with open(self.log_path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+
+    def stats(self):
+        return {'agree': self.agree, 'disagree': self.disagree,
+                'fpga_only': self.fpga_only, 'soft_only': self.soft_only}
+
+
+# ======================
+# 처리 속도 측정
+# ======================
+def main(argv=None):
+    from video_sources import open_source
+
+    parser = argparse.ArgumentParser(description='소프트웨어 판정 처리 속도 측정')
+    parser.add_argument('--source', default='synthetic', help="'synthetic' 또는 동영상 파일")
+    parser.add_argument('--frames', type=int, default=1200)
+    parser.add_argument('--process', action='store_true', help='작업 프로세스 경유 (submit/poll)')
+    parser.add_argument('--fps', type=float, default=60.0, help='--process 입력 속도 (0=최대 속도)')
+    args = parser.parse_args(argv)
+
+    source = open_source(args.source)
+    if not source.isOpened():
+        print(f"소스를 열 수 없습니다: {args.source}")
+        return 1
+    frame = None
+    calls = []
+    judge = tracker = None
+    small = np.empty((JUDGE_HEIGHT, JUDGE_WIDTH, 3), dtype=np.uint8)
+    interval = 0.0
+    if args.process:
+        judge = SoftJudge()
+        judge.start()
+        if not judge.wait_ready():
+            print("소프트웨어 판정 프로세스가 시작되지 않았습니다.")
+            judge.stop()
+            return 1
+        # 카메라처럼 일정한 간격으로 넘김 (최대 속도로 넣으면 대부분 버려짐)
+        interval = 1.0 / args.fps if args.fps else 0.0
+    else:
+        tracker = BallTracker()
+
+    frames = 0
+    t0 = next_frame = time.perf_counter()
+    for _ in range(args.frames):
+        ret, frame = source.read(frame)
+        if not ret:
+            break
+        frames += 1
+        if judge is not None:
+            if interval:
+                delay = next_frame - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                next_frame += interval
+            judge.submit(frame)
+            calls.extend(judge.poll())
+        else:
+            cv2.resize(frame, (JUDGE_WIDTH, JUDGE_HEIGHT), dst=small, interpolation=cv2.INTER_NEAREST)
+            call = tracker.update(small, time.monotonic())
+            if call is not None:
+                calls.append(call)
+    elapsed = time.perf_counter() - t0
+    source.release()
+
+    if judge is not None:
+        judge.drain()
+        calls.extend(judge.poll())
+        stats = judge.stats()
+        judge.stop()
+        print(f"입력 {frames} frames ({frames / elapsed if elapsed else 0:.0f} FPS)  "
+              f"처리 {stats['processed']}  버림 {stats['dropped']}")
+    else:
+        print(f"{frames} frames  {frames / elapsed if elapsed else 0:.0f} FPS")
+    kinds = ''.join(call.kind for call in calls)
+    print(f"판정 {len(calls)}개 (S {kinds.count('S')}, B {kinds.count('B')})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,75 @@
+from PyQt5.QtCore import QObject, QUrl
+from PyQt5.QtMultimedia import QMediaContent, QMediaPlayer, QSoundEffect
+
+# 효과음 이름 -> (파일, 볼륨 0~1)
+DEFAULT_EFFECTS = {
+    'strike': ('sound_strike.wav', 1.0),
+    'ball': ('sound_ball.wav', 1.0),
+    'out': ('sound_out.wav', 0.6),
+}
+OUT_SONG = 'out_song.mp3'
+
+
+# ======================
+# 효과음 엔진
+# ======================
+class SoundEngine(QObject):
+    """효과음을 한 번만 디코딩해 두고 보이스 풀에서 재생.
+
+    WAV 효과음은 이름마다 QSoundEffect 를 voices 개 만들어 돌아가며 쓰므로
+    연속 판정에서도 앞 소리를 끊지 않고 겹쳐 재생된다. 이닝 종료 노래(mp3)는
+    미디어를 미리 설정해 둔 전용 QMediaPlayer 로 재생하며, 재생하는 동안
+    배경음악을 멈췄다가 끝나면 다시 튼다.
+    """
+
+    def __init__(self, effects=None, song=OUT_SONG, voices=3, bgm_player=None, parent=None):
+        super().__init__(parent)
+        self.bgm_player = bgm_player
+        self._voices = {}
+        self._next_voice = {}
+        for name, (path, volume) in (effects or DEFAULT_EFFECTS).items():
+            pool = []
+            for _ in range(voices):
+                effect = QSoundEffect(self)
+                effect.setSource(QUrl.fromLocalFile(path))
+                effect.setVolume(volume)
+                pool.append(effect)
+            self._voices[name] = pool
+            self._next_voice[name] = 0
+
+        self.song_player = QMediaPlayer(self)
+        self.song_player.setMedia(QMediaContent(QUrl.fromLocalFile(song)))
+        self.song_player.setVolume(100)
+        self.song_player.mediaStatusChanged.connect(self._song_status)
+
+    def play(self, name):
+        pool = self._voices.get(name)
+        if not pool:
+            return
+        # 쉬고 있는 보이스를 우선, 없으면 가장 오래된 보이스를 재사용
+        start = self._next_voice[name]
+        for i in range(len(pool)):
+            index = (start + i) % len(pool)
+            if not pool[index].isPlaying():
+                break
+        else:
+            index = start
+        self._next_voice[name] = (index + 1) % len(pool)
+        pool[index].play()
+
+    def play_song(self):
+        """이닝 종료 노래. 재생 중에는 배경음악을 잠시 멈춤."""
+        if self.bgm_player:
+            self.bgm_player.pause()
+        self.song_player.stop()
+        self.song_player.play()
+
+    def _song_status(self, status):
+        if status == QMediaPlayer.EndOfMedia and self.bgm_player:
+            self.bgm_player.play()
+
+    def stop(self):
+        for pool in self._voices.values():
+            for effect in pool:
+                effect.stop()
+        self.song_player.stop()
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 테스트는 code/python 의 모듈을 그대로 import 한다
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
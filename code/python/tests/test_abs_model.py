@@ -0,0 +1,33 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from abs_model import FB_HEIGHT, FB_WIDTH, SCAN_Y, ChromaKeyDetector, rgb888_to_rgb565
+
+
+def _frame(green_cols):
+    rgb = np.zeros((FB_HEIGHT, FB_WIDTH, 3), dtype=np.uint8)
+    rgb[SCAN_Y // 2, green_cols, 1] = 255
+    return rgb888_to_rgb565(rgb)
+
+
+def test_blob_min_max_include_read_latency():
+    # 버퍼 x=100..119 -> VGA 읽기 주소 200..239 -> rData 한 클럭 뒤라 화면 x=201..240
+    # chr_cnt 가 5 에 도달한 다음 픽셀(201 + 6)부터 cnt_flag
+    detector = ChromaKeyDetector()
+    assert detector.process_rgb565(_frame(slice(100, 120))) == (207, 240)
+
+
+def test_blob_at_right_edge_loses_last_pixel():
+    # 마지막 읽기 값은 x=640 (화면 밖) 에 나오므로 639 까지만
+    detector = ChromaKeyDetector()
+    assert detector.process_rgb565(_frame(slice(300, 320))) == (607, 639)
+
+
+def test_previous_line_tail_reaches_pixel_zero():
+    # x=0 은 윗줄 마지막 픽셀 값 (blanking 동안 유지)
+    rgb = np.zeros((FB_HEIGHT, FB_WIDTH, 3), dtype=np.uint8)
+    rgb[(SCAN_Y - 1) // 2, FB_WIDTH - 1, 1] = 255
+    rgb[SCAN_Y // 2, :10, 1] = 255
+    detector = ChromaKeyDetector()
+    assert detector.process_rgb565(rgb888_to_rgb565(rgb)) == (6, 20)
@@ -0,0 +1,72 @@
+import random
+
+from game_state import (INNING_END, MODE_ABS, MODE_TARGET, OUT, RESET, STRIKEOUT, TARGET_HIT, WALK,
+                        GameState)
+
+
+def test_three_strikeouts_end_inning():
+    game = GameState()
+    events = []
+    game.subscribe(lambda event, state: events.append(event))
+    for _ in range(9):
+        game.call('S')
+    assert game.innings == 1
+    assert game.outs == 0
+    assert events.count(INNING_END) == 1
+
+
+def test_reset_clears_everything():
+    game = GameState()
+    for _ in range(9):
+        game.call('S')
+    game.call('B')
+    game.reset(MODE_TARGET)
+    assert (game.balls, game.strikes, game.outs, game.score, game.innings) == (0, 0, 0, 0, 0)
+    assert game.mode == MODE_TARGET
+
+
+def test_reset_emits_reset():
+    game = GameState()
+    events = []
+    game.subscribe(lambda event, state: events.append(event))
+    game.reset()
+    assert events == [RESET]
+
+
+def _both_paths(calls, mode=MODE_ABS, start=None):
+    """같은 판정열을 구독자 있는 경로(이벤트)와 없는 경로(빠른 경로)로 적용."""
+    slow, fast = GameState(mode), GameState(mode)
+    for game in (slow, fast):
+        if start:
+            game.apply(start)
+    slow.subscribe(lambda event, state: None)
+    return slow, slow.apply(calls), fast, fast.apply(calls)
+
+
+def _state(game):
+    return game.balls, game.strikes, game.outs, game.score, game.innings
+
+
+def test_fast_path_matches_event_path():
+    random.seed(14)
+    calls = ''.join(random.choice('SSSBBBBO C') for _ in range(5000))
+    slow, slow_counts, fast, fast_counts = _both_paths(calls)
+    assert _state(fast) == _state(slow)
+    assert fast_counts == slow_counts
+    for event in (WALK, STRIKEOUT, OUT, INNING_END):
+        assert fast_counts[event] > 0
+
+
+def test_fast_path_matches_from_mid_count():
+    # 2스트라이크 2아웃에서 시작해 삼진 -> 이닝 종료, 3볼에서 볼넷
+    slow, slow_counts, fast, fast_counts = _both_paths('SBBB' + 'B', start='SSSSSS' + 'SS')
+    assert _state(fast) == _state(slow) == (0, 0, 0, 0, 1)
+    assert fast_counts == slow_counts
+    assert fast_counts[STRIKEOUT] == fast_counts[INNING_END] == fast_counts[WALK] == 1
+
+
+def test_fast_path_matches_target_mode():
+    slow, slow_counts, fast, fast_counts = _both_paths(b'CSCBC', mode=MODE_TARGET)
+    assert _state(fast) == _state(slow)
+    assert fast_counts == slow_counts
+    assert fast_counts[TARGET_HIT] == 3
@@ -0,0 +1,36 @@
+import sqlite3
+
+from session_store import SCHEMA, _INSERT, event_counts, parse_time, query_events
+
+
+def _db(rows):
+    conn = sqlite3.connect(':memory:')
+    conn.executescript(SCHEMA)
+    conn.executemany(_INSERT, [(sid, t, 1, kind, None, 0, 0, 0, 0, None) for sid, t, kind in rows])
+    return conn
+
+
+ROWS = [(1, 100.0, 'strike'), (1, 150.0, 'ball'), (2, 200.0, 'strike'), (3, 300.0, 'strike')]
+
+
+def test_time_range_across_sessions():
+    conn = _db(ROWS)
+    rows = list(query_events(conn, types=['strike'], since=150.0, until=300.0))
+    assert [(row[0], row[1]) for row in rows] == [(2, 200.0)]
+    assert event_counts(conn, since=100.0, until=200.0) == {'strike': 1, 'ball': 1}
+
+
+def test_time_range_uses_index():
+    conn = _db(ROWS)
+    plans = {
+        'SELECT * FROM events WHERE t >= ? AND t < ?': 'events_time',
+        'SELECT * FROM events WHERE type = ? AND t >= ?': 'events_type_time',
+    }
+    for sql, index in plans.items():
+        detail = ' '.join(row[-1] for row in conn.execute('EXPLAIN QUERY PLAN ' + sql, ('x', 0)))
+        assert index in detail, detail
+
+
+def test_parse_time():
+    assert parse_time('1700000000') == 1700000000.0
+    assert parse_time('2025-03-01 18:00') - parse_time('2025-03-01') == 18 * 3600
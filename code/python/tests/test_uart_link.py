@@ -0,0 +1,71 @@
+from uart_link import (FRAME_SIZE, LEGACY_ON, LEGACY_PROBE_SECONDS, CallDecoder, encode_frame)
+
+
+def _kinds(events):
+    return [event.kind for event in events]
+
+
+def _calls(count, kind='B', min_x=83, max_x=115):
+    return b''.join(encode_frame(kind, seq, 1000 * seq, min_x, max_x) for seq in range(1, count + 1))
+
+
+def test_start_mid_frame_skips_cut_frame():
+    # 재연결 직후: 첫 프레임의 SYNC 는 놓치고 나머지 바이트부터 들어옴
+    decoder = CallDecoder(t_start=0.0)
+    events = decoder.feed(_calls(3)[1:], t_read=0.01)
+    assert _kinds(events) == ['B', 'B']
+    assert decoder.legacy == 0
+
+
+def test_start_mid_frame_byte_by_byte():
+    decoder = CallDecoder(t_start=0.0)
+    events = []
+    for i, byte in enumerate(_calls(3)[5:]):
+        events += decoder.feed(bytes((byte,)), t_read=0.001 * i)
+    assert _kinds(events) == ['B', 'B']
+    assert decoder.legacy == 0
+
+
+def test_bad_crc_first_frame_gives_no_calls():
+    frames = bytearray(_calls(3))
+    frames[12] ^= 0xFF
+    decoder = CallDecoder(t_start=0.0)
+    events = decoder.feed(bytes(frames), t_read=0.01)
+    assert _kinds(events) == ['B', 'B']
+    assert decoder.crc_errors >= 1
+    assert decoder.legacy == 0
+
+
+def test_bad_crc_span_not_read_as_legacy():
+    # 레거시 모드라도 CRC 가 틀린 프레임 내용은 문자로 읽지 않음
+    frame = bytearray(encode_frame('S', 1, 0, ord('B'), ord('S')))
+    frame[-1] ^= 0xFF
+    decoder = CallDecoder(legacy=LEGACY_ON)
+    assert _kinds(decoder.feed(bytes(frame) + b'S')) == ['S']
+
+
+def test_auto_falls_back_to_legacy_without_sync():
+    decoder = CallDecoder(t_start=0.0)
+    assert decoder.feed(b'S', t_read=0.1) == []
+    assert _kinds(decoder.feed(b'BS', t_read=LEGACY_PROBE_SECONDS + 0.1)) == ['B', 'S']
+
+
+def test_legacy_on_decodes_characters():
+    decoder = CallDecoder(legacy=LEGACY_ON)
+    assert _kinds(decoder.feed(b'S B\r\nb')) == ['S', 'B', 'B']
+
+
+def test_framed_ignores_outside_bytes():
+    decoder = CallDecoder(legacy=LEGACY_ON)
+    assert _kinds(decoder.feed(encode_frame('S', 1, 0) + b'BB' + encode_frame('B', 2, 10))) == ['S', 'B']
+
+
+def test_stray_sync_byte_does_not_block_legacy_fallback():
+    # 레거시 보드에서 잡음 0xA5 한 바이트: CRC 가 틀리므로 v1 보드로 보지 않음
+    decoder = CallDecoder(t_start=0.0)
+    stray = b'S\xa5' + b'x' * (FRAME_SIZE - 1)
+    assert decoder.feed(stray, t_read=0.1) == []
+    assert decoder.crc_errors == 1
+    events = decoder.feed(b'SBS', t_read=LEGACY_PROBE_SECONDS + 0.1)
+    assert _kinds(events) == ['S', 'B', 'S']
+    assert not decoder.framed
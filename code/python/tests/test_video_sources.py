@@ -0,0 +1,21 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+pytest.importorskip('cv2')
+
+from video_sources import MemorySource
+
+
+def test_memory_source_empty_returns_false():
+    for loop in (True, False):
+        source = MemorySource([], loop=loop)
+        assert not source.isOpened()
+        ret, image = source.read()
+        assert not ret and image is None
+
+
+def test_memory_source_loops():
+    frames = [np.full((2, 2, 3), i, dtype=np.uint8) for i in range(2)]
+    source = MemorySource(frames)
+    values = [int(source.read()[1][0, 0, 0]) for _ in range(3)]
+    assert values == [0, 1, 0]
@@ -0,0 +1,141 @@
+"""판정 경로 추적: FPGA 판정 바이트 수신부터 배너가 화면에 그려질 때까지.
+
+한 판정의 단계 (모두 perf_counter, 기준은 UARTThread 가 바이트를 읽은 시각)
+
+    read -> decode (UART 스레드) -> state (GameState 반영) -> effect (배너 시작)
+         -> paint (배너 첫 paintEvent)
+
+단계별 누적 지연은 LatencyHistogram 에, 구간은 Chrome trace 이벤트로 남긴다
+(chrome://tracing 또는 https://ui.perfetto.dev 에서 열기). 호출하는 쪽은
+`if tracer.enabled:` 로 감싸므로 꺼져 있을 때 비용은 속성 한 번 읽는 것뿐이다.
+
+시작 단계별 경과 시간(--profile-startup)은 startup 에 기록한다.
+"""
+import json
+import threading
+import time
+from collections import deque
+
+from uart_link import LatencyHistogram
+
+TRACE_CAPACITY = 200_000       # 보관할 Chrome trace 이벤트 수 (오래된 것부터 버림)
+_THREAD_IDS = {'gui': 1, 'uart': 2, 'capture': 3}
+
+
+class Tracer:
+    def __init__(self, capacity=TRACE_CAPACITY):
+        self.enabled = False
+        self.histograms = {}
+        self._events = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._chain = None           # GUI 스레드에서만 사용: 현재 판정의 단계 기록
+        self._t0 = time.perf_counter()
+
+    def enable(self, on=True):
+        self.enabled = on
+        if not on:
+            self._chain = None
+
+    def histogram(self, name):
+        hist = self.histograms.get(name)
+        if hist is None:
+            with self._lock:
+                hist = self.histograms.setdefault(name, LatencyHistogram())
+        return hist
+
+    # ======================
+    # 독립 구간 (어느 스레드든)
+    # ======================
+    def span(self, name, t_start, t_end=None, thread='gui', **args):
+        """t_start ~ t_end 구간을 히스토그램과 trace 에 기록."""
+        if t_end is None:
+            t_end = time.perf_counter()
+        self.histogram(name).record(t_end - t_start)
+        self._events.append((name, t_start, t_end, thread, args))
+
+    def record(self, name, seconds):
+        """trace 없이 히스토그램에만 기록 (예: 프레임 나이)."""
+        self.histogram(name).record(seconds)
+
+    # ======================
+    # 판정 한 건의 단계 (GUI 스레드)
+    # ======================
+    def begin(self, t_read, kind=''):
+        self._chain = {'t0': t_read, 'last': t_read, 'kind': kind, 'done': set()}
+
+    def stage(self, name, t=None):
+        """현재 판정의 name 단계 도달. 판정마다 단계별로 처음 한 번만 기록."""
+        chain = self._chain
+        if chain is None or name in chain['done']:
+            return
+        if t is None:
+            t = time.perf_counter()
+        chain['done'].add(name)
+        self.histogram(f"read->{name}").record(t - chain['t0'])
+        self._events.append((name, chain['last'], t, 'gui', {'call': chain['kind']}))
+        chain['last'] = t
+
+    # ======================
+    # 출력
+    # ======================
+    def summary(self):
+        lines = []
+        for name in sorted(self.histograms):
+            hist = self.histograms[name]
+            lines.append(f"{name:>18}: n={hist.count} mean={hist.mean_us():.0f}us "
+                         f"p50<={hist.percentile(50):.0f}us p99<={hist.percentile(99):.0f}us "
+                         f"max={hist.max_us:.0f}us")
+        return "\n".join(lines)
+
+    def export_chrome(self, path):
+        """Chrome trace JSON 으로 저장. 저장한 이벤트 수 반환."""
+        trace = [{'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': tid, 'args': {'name': name}}
+                 for name, tid in _THREAD_IDS.items()]
+        for name, t_start, t_end, thread, args in list(self._events):
+            trace.append({
+                'name': name, 'ph': 'X', 'pid': 1, 'tid': _THREAD_IDS.get(thread, 0),
+                'ts': (t_start - self._t0) * 1e6, 'dur': (t_end - t_start) * 1e6, 'args': args,
+            })
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': trace, 'displayTimeUnit': 'ms'}, f)
+        return len(trace) - len(_THREAD_IDS)
+
+    def reset(self):
+        self.histograms = {}
+        self._events.clear()
+        self._chain = None
+
+
+# ======================
+# 시작 단계 시간 (--profile-startup)
+# ======================
+class StartupProfile:
+    """프로세스 시작(t0)부터 각 단계에 처음 도달한 시각. 어느 스레드든 mark 가능."""
+
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self.marks = {}
+
+    def start(self, t0):
+        """실행 파일이 import 전에 잰 시각으로 기준점을 옮김."""
+        self.t0 = t0
+
+    def mark(self, name, t=None):
+        if name not in self.marks:
+            self.marks[name] = time.perf_counter() if t is None else t
+
+    def elapsed_ms(self, name):
+        t = self.marks.get(name)
+        return None if t is None else (t - self.t0) * 1000
+
+    def report(self):
+        lines = []
+        last = self.t0
+        for name, t in sorted(self.marks.items(), key=lambda item: item[1]):
+            lines.append(f"{name:>20}: {(t - self.t0) * 1000:8.1f}ms  (+{(t - last) * 1000:.1f}ms)")
+            last = t
+        return "\n".join(lines)
+
+
+tracer = Tracer()
+startup = StartupProfile()
@@ -0,0 +1,270 @@
+import binascii
+import bisect
+import struct
+import threading
+import time
+
+# ======================
+# UART 프로토콜
+# ======================
+# 레거시: ascii.sv 는 줄바꿈 없이 'S'/'B'/'O' 한 바이트씩 보내고, 모드2 표적 적중은 'C'
+LEGACY_CALLS = b'SBOC'
+_NOT_CALLS = bytes(b for b in range(256) if b not in LEGACY_CALLS)
+_CALLS_AND_SPACE = LEGACY_CALLS + LEGACY_CALLS.lower() + b'\r\n\t '
+
+# 프레임 (v1, little endian, 14바이트):
+#   SYNC(0xA5) VER SEQ TICK(u32) EVENT MIN_X(u16) MAX_X(u16) CRC16(u16)
+#   - TICK  : FPGA 프리런 카운터 (FPGA_TICK_HZ 단위)
+#   - EVENT : 레거시와 같은 ASCII 문자 ('S', 'B', 'O', 'C')
+#   - MIN_X/MAX_X : ChromaKey_Detector 의 chr_min_x / chr_max_x
+#   - CRC16 : CRC-16/CCITT (binascii.crc_hqx, 초기값 0xFFFF), VER~MAX_X 범위
+# SYNC 바이트는 ASCII 범위 밖이라 레거시 스트림과 섞여 있어도 구분된다.
+FRAME_SYNC = 0xA5
+PROTOCOL_VERSION = 1
+FPGA_TICK_HZ = 1_000_000
+_FRAME_BODY = struct.Struct('<BBIBHH')
+_FRAME_CRC = struct.Struct('<H')
+FRAME_SIZE = 1 + _FRAME_BODY.size + _FRAME_CRC.size
+
+# --- 레거시 단일 문자 해석 ('auto' / 'on' / 'off') ---
+#   auto : 연결 후 LEGACY_PROBE_SECONDS 초 또는 LEGACY_PROBE_BYTES 바이트 동안 CRC 가 맞는
+#          프레임이 없으면 레거시 보드로 보고 그때부터 문자 해석. 그 전 바이트는 버림
+#          (잡음으로 들어온 0xA5 한 바이트는 판단에 영향 없음)
+#   on   : ascii.sv 보드. 처음부터 문자 해석 (올바른 프레임이 오면 v1 로 전환)
+#   off  : v1 프레임만
+LEGACY_AUTO = 'auto'
+LEGACY_ON = 'on'
+LEGACY_OFF = 'off'
+LEGACY_PROBE_SECONDS = 2.0
+LEGACY_PROBE_BYTES = 4 * FRAME_SIZE
+
+
+class UartEvent:
+    """디코딩된 판정 하나. 레거시 문자는 seq/tick/좌표가 None."""
+    __slots__ = ('kind', 'seq', 'tick', 'min_x', 'max_x', 'link_delay')
+
+    def __init__(self, kind, seq=None, tick=None, min_x=None, max_x=None):
+        self.kind = kind
+        self.seq = seq
+        self.tick = tick
+        self.min_x = min_x
+        self.max_x = max_x
+        self.link_delay = None
+
+    @property
+    def has_position(self):
+        return self.min_x is not None
+
+    def __repr__(self):
+        return f"UartEvent({self.kind!r}, seq={self.seq}, tick={self.tick}, x={self.min_x}~{self.max_x})"
+
+
+def encode_frame(kind, seq, tick, min_x=0, max_x=0, version=PROTOCOL_VERSION):
+    """FPGA 가 보내는 것과 같은 v1 프레임 (테스트/리플레이용)."""
+    body = _FRAME_BODY.pack(version, seq & 0xFF, tick & 0xFFFFFFFF, ord(kind), min_x, max_x)
+    return bytes((FRAME_SYNC,)) + body + _FRAME_CRC.pack(binascii.crc_hqx(body, 0xFFFF))
+
+
+class CallDecoder:
+    """레거시 단일 문자와 v1 프레임이 섞인 바이트 스트림의 증분 디코더.
+
+    read()가 돌려준 조각을 그대로 feed() 하면 UartEvent 목록을 돌려준다.
+    프레임 밖 구간은 bytes.translate 로 한 번에 판정 문자만 남기고, 프레임은
+    struct/crc_hqx 로 처리하므로 바이트마다 파이썬 코드를 돌지 않는다.
+    같은 seq 가 연속으로 오면 재전송으로 보고 버린다.
+
+    올바른 프레임을 한 번 받은 뒤(framed)에는 FPGA 가 v1 으로 말한다고 보고
+    프레임 밖 바이트를 레거시 문자로 해석하지 않는다. 레거시 해석은 legacy
+    설정('auto' 면 올바른 프레임 없이 시간/바이트 한도를 넘긴 뒤)에서만 하고, CRC 가
+    틀린 프레임 구간은 어느 모드에서도 문자로 읽지 않는다. 재연결 직후 들어온
+    잘린 프레임 뒷부분이나 깨진 프레임 내용이 가짜 'S'/'B' 가 되지 않게 하기 위함이다.
+    """
+
+    def __init__(self, tick_hz=FPGA_TICK_HZ, legacy=LEGACY_AUTO, t_start=None):
+        self.tick_hz = tick_hz
+        self.legacy_mode = legacy
+        self._t_start = time.perf_counter() if t_start is None else t_start
+        self._fallback = False
+        self._probe_bytes = 0
+        self._guard = 0             # 버퍼에서 이 위치 전까지는 CRC 실패 구간 (문자 해석 금지)
+        self._buf = bytearray()
+        self._last_seq = None
+        self._min_offset = None
+        self._last_tick = None
+        self._tick_wraps = 0
+        self.framed = False
+        self.frames = 0
+        self.legacy = 0
+        self.duplicates = 0
+        self.lost = 0
+        self.crc_errors = 0
+        self.discarded = 0
+
+    def feed(self, chunk, t_read=None):
+        now = time.perf_counter() if t_read is None else t_read
+        buf = self._buf
+        buf += chunk
+        events = []
+        pos = 0
+        size = len(buf)
+        while pos < size:
+            sync = buf.find(FRAME_SYNC, pos)
+            end = size if sync < 0 else sync
+            if end > pos:
+                self._outside(buf, pos, end, events, now)
+            if sync < 0:
+                pos = size
+                break
+            if size - sync < FRAME_SIZE:
+                # 나머지는 다음 조각과 합쳐서 처리
+                pos = sync
+                break
+            event = self._frame(buf, sync, t_read)
+            if event is None:
+                # CRC 불일치: 안쪽의 SYNC 는 다시 탐색하되, 이 구간은 문자로 읽지 않음
+                self._guard = max(self._guard, sync + FRAME_SIZE)
+                self.discarded += 1
+                pos = sync + 1
+                continue
+            if event is not False:
+                events.append(event)
+            pos = sync + FRAME_SIZE
+        del buf[:pos]
+        self._guard = max(0, self._guard - pos)
+        return events
+
+    def _legacy_active(self, now):
+        if self.framed or self.legacy_mode == LEGACY_OFF:
+            return False
+        if self.legacy_mode == LEGACY_ON or self._fallback:
+            return True
+        # 올바른 프레임이 오면 framed 가 되어 위에서 끝나므로 여기는 아직 프레임이 없을 때
+        if now - self._t_start >= LEGACY_PROBE_SECONDS or self._probe_bytes >= LEGACY_PROBE_BYTES:
+            self._fallback = True
+            return True
+        return False
+
+    def _outside(self, buf, pos, end, events, now):
+        """프레임 밖 buf[pos:end]. CRC 실패 구간은 버리고 나머지는 모드에 따라."""
+        guard = min(self._guard, end)
+        if guard > pos:
+            self.discarded += guard - pos
+            pos = guard
+        if pos >= end:
+            return
+        segment = bytes(buf[pos:end])
+        if not self._legacy_active(now):
+            # 첫 올바른 프레임 전 (auto 탐색 중) 또는 v1 확정 뒤: 문자로 해석하지 않음
+            self.discarded += len(segment)
+            if not self.framed:
+                self._probe_bytes += len(segment)
+            return
+        self.discarded += len(segment.translate(None, _CALLS_AND_SPACE))
+        calls = segment.upper().translate(None, _NOT_CALLS)
+        self.legacy += len(calls)
+        events.extend(UartEvent(chr(byte)) for byte in calls)
+
+    def _frame(self, buf, start, t_read):
+        body = bytes(buf[start + 1:start + 1 + _FRAME_BODY.size])
+        (crc,) = _FRAME_CRC.unpack_from(buf, start + 1 + _FRAME_BODY.size)
+        if binascii.crc_hqx(body, 0xFFFF) != crc:
+            self.crc_errors += 1
+            return None
+        version, seq, tick, kind, min_x, max_x = _FRAME_BODY.unpack(body)
+        if version != PROTOCOL_VERSION:
+            self.discarded += FRAME_SIZE
+            return False
+        if seq == self._last_seq:
+            self.duplicates += 1
+            return False
+        if self._last_seq is not None:
+            self.lost += (seq - self._last_seq - 1) & 0xFF
+        self._last_seq = seq
+        self.framed = True
+        self.frames += 1
+        event = UartEvent(chr(kind), seq, tick, min_x, max_x)
+        if t_read is not None:
+            # u32 카운터 랩어라운드 보정
+            if self._last_tick is not None and tick < self._last_tick:
+                self._tick_wraps += 1
+            self._last_tick = tick
+            tick += self._tick_wraps << 32
+            # FPGA 시계와 PC 시계의 차이 중 최소값을 기준으로 상대 지연을 추정
+            offset = t_read - tick / self.tick_hz
+            if self._min_offset is None or offset < self._min_offset:
+                self._min_offset = offset
+            event.link_delay = offset - self._min_offset
+        return event
+
+    def stats(self):
+        return {
+            'mode': 'v1' if self.framed else ('legacy' if self._legacy_active(time.perf_counter()) else 'probe'),
+            'frames': self.frames,
+            'legacy': self.legacy,
+            'duplicates': self.duplicates,
+            'lost': self.lost,
+            'crc_errors': self.crc_errors,
+            'discarded': self.discarded,
+        }
+
+
+# ======================
+# 지연 시간 히스토그램
+# ======================
+# 버킷 경계 (마이크로초)
+LATENCY_BUCKETS_US = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 25000, 50000, 100000)
+
+
+class LatencyHistogram:
+    """고정 버킷 지연 시간 히스토그램. record()는 초 단위 값을 받는다."""
+
+    def __init__(self, bounds_us=LATENCY_BUCKETS_US):
+        self.bounds_us = tuple(bounds_us)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.counts = [0] * (len(self.bounds_us) + 1)
+        self.count = 0
+        self.total_us = 0.0
+        self.max_us = 0.0
+
+    def record(self, seconds):
+        us = seconds * 1e6
+        index = bisect.bisect_right(self.bounds_us, us)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.total_us += us
+            if us > self.max_us:
+                self.max_us = us
+
+    def percentile(self, p):
+        """p(0~100) 백분위가 속한 버킷의 상한 (마이크로초)."""
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = self.count * p / 100.0
+            seen = 0
+            for index, n in enumerate(self.counts):
+                seen += n
+                if seen >= rank and n:
+                    if index < len(self.bounds_us):
+                        return float(self.bounds_us[index])
+                    return self.max_us
+            return self.max_us
+
+    def mean_us(self):
+        return self.total_us / self.count if self.count else 0.0
+
+    def summary(self):
+        lines = [f"n={self.count} mean={self.mean_us():.0f}us "
+                 f"p50<={self.percentile(50):.0f}us p99<={self.percentile(99):.0f}us max={self.max_us:.0f}us"]
+        lower = 0
+        for index, n in enumerate(self.counts):
+            upper = self.bounds_us[index] if index < len(self.bounds_us) else None
+            label = f"{lower}-{upper}us" if upper is not None else f">={lower}us"
+            lines.append(f"  {label:>14}: {n}")
+            if upper is not None:
+                lower = upper
+        return "\n".join(lines)
@@ -0,0 +1,236 @@
+"""UART 세션 녹화/재생 및 처리량 벤치마크.
+
+보드 없이 UARTThread + handle_uart_data 경로를 부하 테스트하기 위한 도구.
+pty 로 가상 시리얼 장치를 만들고, 녹화 파일을 실시간(1x) 또는 최대 속도로
+흘려보낸다. (replay / bench 는 Linux / macOS 전용: pty 필요. record 는 Windows 에서도 동작)
+
+    python uart_replay.py record COM13 session.uart        # 실제 보드 세션 녹화
+    python uart_replay.py replay session.uart --speed 1    # 가상 포트로 재생
+    python uart_replay.py bench --events 100000            # 처리량/지연 측정
+    python uart_replay.py bench --file session.uart --speed 0
+"""
+import argparse
+import os
+import random
+import statistics
+import struct
+import sys
+import threading
+import time
+
+from game_state import GameState
+from uart_link import LEGACY_AUTO, LEGACY_OFF, LEGACY_ON, CallDecoder, encode_frame
+
+# 녹화 파일: 헤더 뒤에 (경과 시간 f64, 길이 u32, 바이트) 레코드 반복
+RECORD_MAGIC = b'ABSUART1'
+_RECORD = struct.Struct('<dI')
+
+
+# ======================
+# 녹화 / 재생
+# ======================
+class SessionRecorder:
+    """read()로 받은 조각을 받은 시각과 함께 파일에 기록."""
+
+    def __init__(self, path):
+        self._file = open(path, 'wb')
+        self._file.write(RECORD_MAGIC)
+        self._t0 = time.perf_counter()
+
+    def write(self, chunk, t_read=None):
+        if t_read is None:
+            t_read = time.perf_counter()
+        self._file.write(_RECORD.pack(t_read - self._t0, len(chunk)))
+        self._file.write(chunk)
+
+    def close(self):
+        self._file.close()
+
+
+def load_session(path):
+    """녹화 파일을 [(경과 시간, 바이트), ...] 로 읽는다."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if not data.startswith(RECORD_MAGIC):
+        raise ValueError(f"'{path}' 는 UART 녹화 파일이 아닙니다.")
+    records = []
+    pos = len(RECORD_MAGIC)
+    while pos + _RECORD.size <= len(data):
+        offset, length = _RECORD.unpack_from(data, pos)
+        pos += _RECORD.size
+        records.append((offset, data[pos:pos + length]))
+        pos += length
+    return records
+
+
+def replay(records, write, speed=1.0):
+    """records 를 write(bytes)로 흘려보낸다. speed=0 이면 최대 속도."""
+    t0 = time.perf_counter()
+    for offset, chunk in records:
+        if speed > 0:
+            delay = offset / speed - (time.perf_counter() - t0)
+            if delay > 0:
+                time.sleep(delay)
+        write(chunk)
+
+
+def synthetic_session(events, framed=True, rate_hz=0.0, seed=0):
+    """무작위 판정 스트림. rate_hz=0 이면 모든 이벤트 시각이 0."""
+    rng = random.Random(seed)
+    records = []
+    for i in range(events):
+        kind = rng.choice('SSBBO')
+        if framed:
+            min_x = rng.randrange(0, 600)
+            chunk = encode_frame(kind, i, i * 1000, min_x, min_x + rng.randrange(1, 40))
+        else:
+            chunk = kind.encode()
+        records.append((i / rate_hz if rate_hz else 0.0, chunk))
+    return records
+
+
+# ======================
+# 가상 시리얼 장치
+# ======================
+class VirtualSerialPort:
+    """pty 한 쌍. path 를 serial.Serial 에 넘기고 write()로 데이터를 주입."""
+
+    def __init__(self):
+        # tty 는 termios(POSIX 전용)를 쓰므로 여기서 import (record 는 Windows 에서도 쓰도록)
+        if not hasattr(os, 'openpty'):
+            raise OSError("가상 시리얼 포트(pty)는 Linux / macOS 전용입니다.")
+        import tty
+
+        self.master_fd, self.slave_fd = os.openpty()
+        tty.setraw(self.slave_fd)
+        self.path = os.ttyname(self.slave_fd)
+
+    def write(self, data):
+        view = memoryview(data)
+        while view:
+            n = os.write(self.master_fd, view)
+            view = view[n:]
+
+    def close(self):
+        os.close(self.master_fd)
+        os.close(self.slave_fd)
+
+
+# ======================
+# 벤치마크
+# ======================
+def run_bench(records, speed=0.0, baudrate=9600, legacy=LEGACY_AUTO):
+    """가상 포트로 records 를 재생하면서 UARTThread 와 같은 읽기 루프로 처리."""
+    import serial
+
+    port = VirtualSerialPort()
+    ser = serial.Serial(port.path, baudrate, timeout=0.1)
+    counter = CallDecoder(legacy=legacy)
+    expected = sum(len(counter.feed(chunk)) for _, chunk in records)
+    decoder = CallDecoder(legacy=legacy)
+    board = GameState()
+    latencies = []
+    done = threading.Event()
+
+    def reader():
+        while len(latencies) < expected:
+            chunk = ser.read(ser.in_waiting or 1)
+            if not chunk:
+                if done.is_set():
+                    break
+                continue
+            t_read = time.perf_counter()
+            for event in decoder.feed(chunk, t_read):
+                board.call(event.kind)
+                latencies.append(time.perf_counter() - t_read)
+
+    thread = threading.Thread(target=reader, daemon=True)
+    t0 = time.perf_counter()
+    thread.start()
+    replay(records, port.write, speed)
+    done.set()
+    thread.join()
+    elapsed = time.perf_counter() - t0
+    ser.close()
+    port.close()
+
+    latencies.sort()
+    n = len(latencies)
+    return {
+        'events': n,
+        'expected': expected,
+        'seconds': elapsed,
+        'events_per_sec': n / elapsed if elapsed else 0.0,
+        'p50_us': latencies[n // 2] * 1e6 if n else 0.0,
+        'p99_us': latencies[min(n - 1, int(n * 0.99))] * 1e6 if n else 0.0,
+        'mean_us': statistics.fmean(latencies) * 1e6 if n else 0.0,
+        'decoder': decoder.stats(),
+    }
+
+
+def record_port(port, path, baudrate=9600):
+    import serial
+
+    ser = serial.Serial(port, baudrate, timeout=0.1)
+    recorder = SessionRecorder(path)
+    print(f"{port} 녹화 중 -> {path} (Ctrl+C 로 종료)")
+    try:
+        while True:
+            chunk = ser.read(ser.in_waiting or 1)
+            if chunk:
+                recorder.write(chunk)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        recorder.close()
+        ser.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='UART 세션 녹화/재생/벤치마크')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('record', help='실제 시리얼 포트 세션 녹화')
+    p.add_argument('port')
+    p.add_argument('path')
+    p.add_argument('--baudrate', type=int, default=9600)
+
+    p = sub.add_parser('replay', help='녹화 파일을 가상 포트로 재생')
+    p.add_argument('path')
+    p.add_argument('--speed', type=float, default=1.0, help='1=실시간, 0=최대 속도')
+
+    p = sub.add_parser('bench', help='읽기/디코드/카운트 처리량 측정')
+    p.add_argument('--file', help='녹화 파일 (없으면 합성 스트림)')
+    p.add_argument('--events', type=int, default=10000)
+    p.add_argument('--legacy', action='store_true', help='합성 스트림을 단일 문자로')
+    p.add_argument('--speed', type=float, default=0.0)
+    p.add_argument('--protocol', choices=[LEGACY_AUTO, LEGACY_ON, LEGACY_OFF], default=None,
+                   help="디코더의 레거시 문자 해석 (기본: --legacy 면 on, 아니면 auto)")
+
+    args = parser.parse_args(argv)
+    if args.command == 'record':
+        record_port(args.port, args.path, args.baudrate)
+    elif args.command == 'replay':
+        port = VirtualSerialPort()
+        print(f"가상 포트: {port.path}  (UARTThread 의 port 로 지정)")
+        input("연결 후 Enter ...")
+        replay(load_session(args.path), port.write, args.speed)
+        input("재생 완료. Enter 로 종료 ...")
+        port.close()
+    else:
+        if args.file:
+            records = load_session(args.file)
+        else:
+            records = synthetic_session(args.events, framed=not args.legacy)
+        legacy = args.protocol or (LEGACY_ON if args.legacy else LEGACY_AUTO)
+        result = run_bench(records, args.speed, legacy=legacy)
+        print(f"이벤트 {result['events']}/{result['expected']}  {result['seconds']:.3f}s  "
+              f"{result['events_per_sec']:.0f} events/s")
+        print(f"decode->scoreboard  p50 {result['p50_us']:.1f}us  p99 {result['p99_us']:.1f}us  "
+              f"mean {result['mean_us']:.1f}us")
+        print(f"decoder {result['decoder']}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
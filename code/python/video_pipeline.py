@@ -0,0 +1,383 @@
+import threading
+import time
+from collections import deque
+
+import cv2
+import numpy as np
+from PyQt5.QtCore import Qt, QRect
+from PyQt5.QtGui import QImage, QPainter
+from PyQt5.QtWidgets import QWidget
+
+# --- 스케일 모드 ---
+SCALE_FAST = 'fast'      # 최근접 보간, 가장 가벼움
+SCALE_SMOOTH = 'smooth'  # 면적 보간, 축소 화질 우선
+
+_CV_INTERPOLATION = {
+    SCALE_FAST: cv2.INTER_NEAREST,
+    SCALE_SMOOTH: cv2.INTER_AREA,
+}
+
+# ======================
+# 재사용 RGB 버퍼 링
+# ======================
+class FrameSlot:
+    """링에 속한 RGB 버퍼 하나와 그 위에 만들어 둔 QImage.
+
+    QImage 는 버퍼를 복사하지 않고 가리키기만 하므로, 소비자가 release()
+    하기 전까지 슬롯은 다시 쓰이지 않는다.
+    """
+    __slots__ = ('ring', 'rgb', 'image', 'timestamp', 'seq', '_refs')
+
+    def __init__(self, ring, width, height):
+        self.ring = ring
+        self.rgb = np.empty((height, width, 3), dtype=np.uint8)
+        self.image = QImage(self.rgb.data, width, height, width * 3, QImage.Format_RGB888)
+        self.timestamp = 0.0
+        self.seq = 0
+        self._refs = 0
+
+    def retain(self):
+        self.ring._retain(self)
+        return self
+
+    def release(self):
+        self.ring._release(self)
+
+
+class FrameRing:
+    """미리 할당한 RGB 버퍼를 돌려 쓰는 링.
+
+    캡처 스레드는 acquire()로 빈 슬롯을 받아 cv2.cvtColor(..., dst=slot.rgb)로
+    채우고, 소비자는 다 쓴 뒤 release()로 돌려준다. 빈 슬롯이 없으면
+    acquire()는 None 을 돌려주고 그 프레임은 버린다.
+    """
+
+    def __init__(self, width, height, size=3):
+        self.width = width
+        self.height = height
+        self._lock = threading.Lock()
+        self._slots = [FrameSlot(self, width, height) for _ in range(size)]
+        self._free = list(self._slots)
+        self._seq = 0
+        self.starved = 0
+
+    def matches(self, width, height):
+        return self.width == width and self.height == height
+
+    def acquire(self):
+        with self._lock:
+            if not self._free:
+                self.starved += 1
+                return None
+            slot = self._free.pop()
+            slot._refs = 1
+            self._seq += 1
+            slot.seq = self._seq
+            slot.timestamp = time.monotonic()
+            return slot
+
+    def _retain(self, slot):
+        with self._lock:
+            slot._refs += 1
+
+    def _release(self, slot):
+        with self._lock:
+            slot._refs -= 1
+            if slot._refs == 0:
+                self._free.append(slot)
+
+
+class FrameConverter:
+    """BGR 캡처 프레임을 링 슬롯의 RGB 버퍼로 한 번만 변환한다.
+
+    set_target()으로 출력 크기가 정해지면 캡처 스레드에서 미리 축소해 두므로
+    GUI 스레드는 크기 변환 없이 그리기만 한다.
+    """
+
+    def __init__(self, ring_size=3):
+        self.ring_size = ring_size
+        self.ring = None
+        self._target = None
+        self._scale_mode = SCALE_SMOOTH
+        self._scaled = None
+
+    def set_target(self, width, height, scale_mode=SCALE_SMOOTH):
+        """출력 크기 지정. GUI 스레드에서 호출해도 되도록 튜플 하나로 교체."""
+        self._target = (width, height) if width > 0 and height > 0 else None
+        self._scale_mode = scale_mode
+
+    def convert(self, bgr_frame):
+        # 캡처 직후 시각을 프레임 타임스탬프로 사용 (monotonic)
+        stamp = time.monotonic()
+        target = self._target
+        h, w = bgr_frame.shape[:2]
+        if target is not None and target != (w, h):
+            tw, th = target
+            if self._scaled is None or self._scaled.shape[:2] != (th, tw):
+                self._scaled = np.empty((th, tw, 3), dtype=np.uint8)
+            cv2.resize(bgr_frame, (tw, th), dst=self._scaled,
+                       interpolation=_CV_INTERPOLATION.get(self._scale_mode, cv2.INTER_AREA))
+            bgr_frame = self._scaled
+            w, h = tw, th
+        if self.ring is None or not self.ring.matches(w, h):
+            # 해상도가 바뀌면 링을 새로 만든다 (이전 슬롯은 소비자가 놓으면 해제)
+            self.ring = FrameRing(w, h, self.ring_size)
+        slot = self.ring.acquire()
+        if slot is None:
+            return None
+        slot.timestamp = stamp
+        cv2.cvtColor(bgr_frame, cv2.COLOR_BGR2RGB, dst=slot.rgb)
+        return slot
+
+
+# ======================
+# 최신 프레임 우편함 (latest frame wins)
+# ======================
+class FrameMailbox:
+    """캡처 스레드와 GUI 사이의 단일 슬롯 버퍼.
+
+    put()은 아직 가져가지 않은 프레임을 덮어쓰고 dropped 를 증가시킨다.
+    GUI는 자신의 다시 그리기 주기마다 take()로 가장 최근 프레임만 꺼내므로
+    화면 지연은 렌더링 속도와 관계없이 최대 한 프레임으로 유지된다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._frame = None
+        self._stamp = 0.0
+        self.posted = 0
+        self.delivered = 0
+        self.dropped = 0
+
+    def put(self, frame):
+        with self._lock:
+            old = self._frame
+            if old is not None:
+                self.dropped += 1
+            self._frame = frame
+            self._stamp = time.monotonic()
+            self.posted += 1
+        # 덮어쓴 프레임의 버퍼는 링으로 돌려줌
+        if isinstance(old, FrameSlot):
+            old.release()
+
+    def take(self):
+        """가장 최근 프레임을 꺼낸다. 새 프레임이 없으면 None."""
+        with self._lock:
+            frame = self._frame
+            self._frame = None
+            if frame is not None:
+                self.delivered += 1
+            return frame
+
+    def age(self):
+        """대기 중인 프레임이 들어온 뒤 지난 시간(초). 비어 있으면 None."""
+        with self._lock:
+            if self._frame is None:
+                return None
+            return time.monotonic() - self._stamp
+
+    def clear(self):
+        with self._lock:
+            old = self._frame
+            self._frame = None
+        if isinstance(old, FrameSlot):
+            old.release()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'posted': self.posted,
+                'delivered': self.delivered,
+                'dropped': self.dropped,
+            }
+
+
+# ======================
+# 다중 카메라 캡처 관리
+# ======================
+class FrameHistory:
+    """카메라별 최근 프레임 몇 장 (타임스탬프 매칭용)."""
+
+    def __init__(self, depth=4):
+        self.depth = depth
+        self._lock = threading.Lock()
+        self._slots = deque()
+
+    def push(self, slot):
+        slot.retain()
+        with self._lock:
+            self._slots.append(slot)
+            old = self._slots.popleft() if len(self._slots) > self.depth else None
+        if old is not None:
+            old.release()
+
+    def nearest(self, timestamp):
+        """timestamp 에 가장 가까운 슬롯을 retain 해서 돌려준다. 없으면 None."""
+        with self._lock:
+            if not self._slots:
+                return None
+            best = min(self._slots, key=lambda slot: abs(slot.timestamp - timestamp))
+            return best.retain()
+
+    def clear(self):
+        with self._lock:
+            slots = list(self._slots)
+            self._slots.clear()
+        for slot in slots:
+            slot.release()
+
+
+class CaptureManager:
+    """여러 캡처 스레드를 함께 시작/정지하고 동기화된 프레임 묶음을 만든다.
+
+    각 스레드는 자기 FrameConverter/FrameMailbox 를 가지고 독립적으로 돌기
+    때문에 느린 카메라가 다른 카메라를 막지 않는다. 첫 번째 스레드가 기준
+    (main) 카메라이며, take_synced()는 그 최신 프레임과 나머지 카메라에서
+    타임스탬프가 가장 가까운 프레임을 짝지어 돌려준다.
+    """
+
+    def __init__(self, threads, history_depth=4):
+        self.threads = list(threads)
+        self.max_skew = 0.0
+        for thread in self.threads[1:]:
+            thread.history = FrameHistory(history_depth)
+            # 히스토리가 잡고 있는 슬롯만큼 링을 늘림
+            thread.converter.ring_size = history_depth + 3
+
+    @property
+    def primary(self):
+        return self.threads[0] if self.threads else None
+
+    def start(self):
+        for thread in self.threads:
+            thread.start()
+
+    def stop(self):
+        # 모두에게 먼저 정지를 알리고 나서 하나씩 대기
+        for thread in self.threads:
+            thread.running = False
+        for thread in self.threads:
+            thread.stop()
+            if thread.history is not None:
+                thread.history.clear()
+            thread.mailbox.clear()
+
+    def isRunning(self):
+        return any(thread.isRunning() for thread in self.threads)
+
+    def take_synced(self):
+        """(main 슬롯, [보조 슬롯 또는 None, ...]) 또는 새 프레임이 없으면 None."""
+        primary = self.primary
+        slot = primary.mailbox.take() if primary else None
+        if slot is None:
+            return None
+        others = []
+        for thread in self.threads[1:]:
+            # 보조 카메라는 히스토리에서 고르므로 우편함은 비워 둔다
+            thread.mailbox.clear()
+            other = thread.history.nearest(slot.timestamp)
+            if other is not None:
+                self.max_skew = max(self.max_skew, abs(other.timestamp - slot.timestamp))
+            others.append(other)
+        return slot, others
+
+    def stats(self):
+        return [thread.mailbox.stats() for thread in self.threads]
+
+
+def pip_rect(outer, scale=0.3, margin=16):
+    """outer 오른쪽 아래 구석의 picture-in-picture 영역."""
+    w = int(outer.width() * scale)
+    h = int(outer.height() * scale)
+    return QRect(outer.right() - w - margin + 1, outer.bottom() - h - margin + 1, w, h)
+
+
+# ======================
+# 영상 출력 위젯
+# ======================
+class VideoSurface(QWidget):
+    """최신 프레임 슬롯을 paintEvent 에서 바로 그리는 위젯.
+
+    QPixmap 변환과 GUI 스레드 스케일링을 하지 않는다. 크기가 바뀔 때만
+    연결된 FrameConverter 에 새 출력 크기를 알려 캡처 스레드가 축소한다.
+    """
+
+    def __init__(self, parent=None, scale_mode=SCALE_SMOOTH):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.scale_mode = scale_mode
+        self.converter = None
+        self.inset_converter = None
+        self.inset_scale = 0.3
+        self._slot = None
+        self._inset = None
+        self._target_rect = QRect()
+        self._inset_rect = QRect()
+
+    def attach(self, converter):
+        self.converter = converter
+        self._target_rect = self.rect()
+        self._notify_target()
+
+    def attach_inset(self, converter):
+        """보조 카메라를 오른쪽 아래 picture-in-picture 로 표시."""
+        self.inset_converter = converter
+        self._inset_rect = pip_rect(self.rect(), self.inset_scale)
+        self._notify_target()
+
+    def set_scale_mode(self, scale_mode):
+        self.scale_mode = scale_mode
+        self._notify_target()
+        self.update()
+
+    def set_frame(self, slot):
+        """새 슬롯으로 교체하고 이전 슬롯은 링에 돌려준다."""
+        old = self._slot
+        self._slot = slot
+        if old is not None:
+            old.release()
+        self.update()
+
+    def set_inset(self, slot):
+        old = self._inset
+        self._inset = slot
+        if old is not None:
+            old.release()
+
+    def clear_frame(self):
+        self.set_inset(None)
+        self.set_frame(None)
+
+    def _notify_target(self):
+        if self.converter is not None:
+            self.converter.set_target(self.width(), self.height(), self.scale_mode)
+        if self.inset_converter is not None:
+            self.inset_converter.set_target(self._inset_rect.width(), self._inset_rect.height(), self.scale_mode)
+
+    def resizeEvent(self, event):
+        self._target_rect = self.rect()
+        self._inset_rect = pip_rect(self._target_rect, self.inset_scale)
+        self._notify_target()
+        super().resizeEvent(event)
+
+    def _draw(self, painter, rect, image):
+        if image.width() == rect.width() and image.height() == rect.height():
+            # 캡처 스레드에서 이미 맞춘 크기 -> 1:1 복사
+            painter.drawImage(rect.topLeft(), image)
+        else:
+            # 새 크기가 반영되기 전 몇 프레임만 여기서 스케일
+            painter.setRenderHint(QPainter.SmoothPixmapTransform, self.scale_mode == SCALE_SMOOTH)
+            painter.drawImage(rect, image)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        slot = self._slot
+        if slot is None:
+            painter.fillRect(self._target_rect, Qt.black)
+            return
+        self._draw(painter, self._target_rect, slot.image)
+        if self._inset is not None:
+            self._draw(painter, self._inset_rect, self._inset.image)
+            painter.setPen(Qt.white)
+            painter.drawRect(self._inset_rect.adjusted(0, 0, -1, -1))
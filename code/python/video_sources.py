@@ -0,0 +1,261 @@
+import sys
+import time
+
+import cv2
+import numpy as np
+
+# ======================
+# 영상 소스
+# ======================
+# 모든 소스는 cv2.VideoCapture 와 같은 isOpened() / read(image=None) / release()
+# 를 제공하므로 VideoThread 는 소스 종류를 몰라도 된다.
+
+# --- 카메라 열기 / 읽기 타임아웃: 장치가 멈춰도 VideoThread 가 재연결 요청을 확인하도록 ---
+CAPTURE_OPEN_TIMEOUT_MS = 5000
+CAPTURE_READ_TIMEOUT_MS = 1000
+
+
+def default_backend():
+    """Windows 는 DirectShow, 그 외에는 OpenCV 가 고르는 백엔드."""
+    return cv2.CAP_DSHOW if sys.platform.startswith('win') else cv2.CAP_ANY
+
+
+def timeout_params():
+    """VideoCapture 열기 인자 [속성, 값, ...]. 이 속성이 없는 OpenCV (4.6 이전) 면 빈 목록."""
+    params = []
+    for name, value in (('CAP_PROP_OPEN_TIMEOUT_MSEC', CAPTURE_OPEN_TIMEOUT_MS),
+                        ('CAP_PROP_READ_TIMEOUT_MSEC', CAPTURE_READ_TIMEOUT_MS)):
+        prop = getattr(cv2, name, None)
+        if prop is not None:
+            params += [prop, value]
+    return params
+
+
+def open_capture(index, backend):
+    """타임아웃을 지정해 VideoCapture 열기 (지원하지 않는 백엔드는 무시)."""
+    params = timeout_params()
+    if params:
+        try:
+            return cv2.VideoCapture(index, backend, params)
+        except (TypeError, cv2.error):
+            pass
+    return cv2.VideoCapture(index, backend)
+
+
+# ======================
+# 캡처 형식 협상
+# ======================
+def fourcc_code(text):
+    return cv2.VideoWriter_fourcc(*text)
+
+
+def fourcc_text(code):
+    code = int(code)
+    return ''.join(chr((code >> (8 * i)) & 0xFF) for i in range(4)).strip('\x00') or '-'
+
+
+class CaptureProfile:
+    """카메라에 요청할 형식. None 인 항목은 드라이버 기본값 그대로.
+
+    fourcc 는 'MJPG' (USB 대역폭 적음, 카메라 두 대용) 또는 'YUY2' (무압축).
+    buffer_size=1 이면 드라이버 큐에 오래된 프레임이 쌓이지 않아 지연이 짧다.
+    """
+
+    def __init__(self, width=None, height=None, fps=None, fourcc=None, buffer_size=1):
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.fourcc = fourcc
+        self.buffer_size = buffer_size
+
+    def __repr__(self):
+        size = f"{self.width}x{self.height}" if self.width and self.height else 'default'
+        return f"{size}@{self.fps or '-'} {self.fourcc or '-'}"
+
+
+def apply_profile(cap, profile):
+    """profile 을 설정하고 장치가 실제로 받아들인 값을 읽어 온다.
+
+    {항목: (요청값, 실제값)}. DirectShow 는 FOURCC 를 해상도보다 먼저 바꿔야
+    MJPG 모드가 선택되므로 이 순서로 설정한다.
+    """
+    if profile.fourcc:
+        cap.set(cv2.CAP_PROP_FOURCC, fourcc_code(profile.fourcc))
+    if profile.width and profile.height:
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, profile.width)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, profile.height)
+    if profile.fps:
+        cap.set(cv2.CAP_PROP_FPS, profile.fps)
+    if profile.buffer_size:
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, profile.buffer_size)
+    return {
+        'width': (profile.width, int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))),
+        'height': (profile.height, int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))),
+        'fps': (profile.fps, round(cap.get(cv2.CAP_PROP_FPS), 2)),
+        'fourcc': (profile.fourcc, fourcc_text(cap.get(cv2.CAP_PROP_FOURCC))),
+        'buffer_size': (profile.buffer_size, int(cap.get(cv2.CAP_PROP_BUFFERSIZE))),
+    }
+
+
+def profile_mismatches(negotiated):
+    """요청했는데 다르게 잡힌 항목 [(이름, 요청값, 실제값)].
+
+    실제값이 0 이면 백엔드가 그 속성을 못 읽는 것이므로 제외한다.
+    """
+    mismatches = []
+    for name, (requested, actual) in negotiated.items():
+        if requested is None or not actual or actual == '-':
+            continue
+        if name == 'fps' and abs(actual - requested) < 0.5:
+            continue
+        if actual != requested:
+            mismatches.append((name, requested, actual))
+    return mismatches
+
+
+class CameraSource:
+    """USB 카메라 (기존 cv2.VideoCapture(index, CAP_DSHOW) 경로).
+
+    profile 을 주면 열자마자 형식을 요청하고, 실제로 잡힌 값은 negotiated 에 남긴다.
+    """
+
+    def __init__(self, index, backend=None, profile=None):
+        self.index = index
+        self.cap = open_capture(index, default_backend() if backend is None else backend)
+        self.negotiated = None
+        if profile is not None and self.cap.isOpened():
+            self.negotiated = apply_profile(self.cap, profile)
+
+    def mode(self):
+        """현재 잡힌 형식 'WxH@fps FOURCC'."""
+        cap = self.cap
+        return (f"{int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))}x{int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))}"
+                f"@{cap.get(cv2.CAP_PROP_FPS):g} {fourcc_text(cap.get(cv2.CAP_PROP_FOURCC))}")
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def read(self, image=None):
+        return self.cap.read(image)
+
+    def release(self):
+        self.cap.release()
+
+
+class FileSource:
+    """동영상 파일. loop=True 면 끝에서 처음으로, realtime=True 면 파일 FPS 로 맞춤."""
+
+    def __init__(self, path, loop=True, realtime=False):
+        self.path = path
+        self.loop = loop
+        self.cap = cv2.VideoCapture(path)
+        fps = self.cap.get(cv2.CAP_PROP_FPS) if self.cap.isOpened() else 0
+        self.interval = 1.0 / fps if realtime and fps > 0 else 0.0
+        self._next = time.perf_counter()
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def read(self, image=None):
+        if self.interval:
+            delay = self._next - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            self._next = max(self._next + self.interval, time.perf_counter())
+        ret, frame = self.cap.read(image)
+        if not ret and self.loop:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self.cap.read(image)
+        return ret, frame
+
+    def release(self):
+        self.cap.release()
+
+
+class SyntheticSource:
+    """야구장 배경 위를 지나가는 초록 공. fps=None 이면 최대 속도로 생성."""
+
+    FIELD_BGR = (60, 110, 150)   # 흙색 배경
+    BALL_BGR = (40, 220, 40)     # ChromaKey_Detector 가 잡는 초록
+
+    def __init__(self, width=640, height=480, fps=None, radius=None, speed=12):
+        self.width = width
+        self.height = height
+        self.interval = 1.0 / fps if fps else 0.0
+        self.radius = radius or max(4, height // 24)
+        self.speed = speed * width / 640.0
+        self.frame_index = 0
+        self._background = np.empty((height, width, 3), dtype=np.uint8)
+        self._background[:] = self.FIELD_BGR
+        # 스트라이크 존 가이드 (고정)
+        cv2.rectangle(self._background, (width * 2 // 5, height // 3), (width * 3 // 5, height * 2 // 3),
+                      (255, 255, 255), 2)
+        self._next = time.perf_counter()
+
+    def isOpened(self):
+        return True
+
+    def ball_position(self, index):
+        """index 번째 프레임의 공 중심 (x, y)."""
+        span = self.width + 2 * self.radius
+        x = int(index * self.speed) % span - self.radius
+        # 화면 가운데 줄(y=height/2)을 지나가도록 살짝 위아래로 흔들림
+        y = self.height // 2 + int(self.height / 10 * np.sin(index / 15.0))
+        return x, y
+
+    def read(self, image=None):
+        if self.interval:
+            delay = self._next - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            self._next = max(self._next + self.interval, time.perf_counter())
+        if image is None or image.shape != self._background.shape:
+            image = np.empty_like(self._background)
+        np.copyto(image, self._background)
+        cv2.circle(image, self.ball_position(self.frame_index), self.radius, self.BALL_BGR, -1)
+        self.frame_index += 1
+        return True, image
+
+    def release(self):
+        pass
+
+
+class MemorySource:
+    """미리 메모리에 올린 BGR 프레임 목록을 순서대로 반복 (디코딩 비용 제외 측정용)."""
+
+    def __init__(self, frames, loop=True):
+        self.frames = list(frames)
+        self.loop = loop
+        self.frame_index = 0
+
+    def isOpened(self):
+        return bool(self.frames)
+
+    def read(self, image=None):
+        if self.frame_index >= len(self.frames):
+            if not self.loop or not self.frames:
+                return False, image
+            self.frame_index = 0
+        frame = self.frames[self.frame_index]
+        self.frame_index += 1
+        if image is None or image.shape != frame.shape:
+            image = np.empty_like(frame)
+        np.copyto(image, frame)
+        return True, image
+
+    def release(self):
+        pass
+
+
+def open_source(spec, profile=None, **kwargs):
+    """정수면 카메라, 'synthetic' 이면 합성 영상, 그 외 문자열은 파일 경로.
+
+    profile(CaptureProfile)은 카메라에만 적용된다.
+    """
+    if isinstance(spec, int):
+        return CameraSource(spec, profile=profile, **kwargs)
+    if isinstance(spec, str) and spec.isdigit():
+        return CameraSource(int(spec), profile=profile, **kwargs)
+    if spec == 'synthetic':
+        return SyntheticSource(**kwargs)
+    return FileSource(spec, **kwargs)